@@ -1,18 +1,30 @@
 #!/usr/bin/env python3
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-from matplotlib.widgets import Button, Slider, RadioButtons
-from matplotlib.patches import Rectangle, Circle
-from numba import jit, cuda
-import time, json, cv2
+from numba import jit, prange
+import numba
+import os, sys, time, json, math, decimal, hashlib
+from decimal import Decimal
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor
-from sklearn.cluster import DBSCAN
-from mpl_toolkits.mplot3d import Axes3D
-import sounddevice as sd, warnings; warnings.filterwarnings('ignore')
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from types import SimpleNamespace
+import threading, queue
+from collections import OrderedDict, deque
+from contextlib import contextmanager, nullcontext
+import warnings; warnings.filterwarnings('ignore')
 
-@jit(nopython=True)
+# GUI, ML, video, audio and CUDA dependencies are imported on first use so the render engines and headless batch
+# rendering start fast and work without a display or those packages installed. Kernels are cached on disk
+# (cache=True), so only the first run on a machine pays for compilation; see warmup()
+plt = animation = Button = Slider = RadioButtons = Rectangle = Circle = None
+
+def load_gui():
+    global plt, animation, Button, Slider, RadioButtons, Rectangle, Circle
+    import matplotlib.pyplot as plt, matplotlib.animation as animation
+    from matplotlib.widgets import Button, Slider, RadioButtons
+    from matplotlib.patches import Rectangle, Circle
+    from mpl_toolkits.mplot3d import Axes3D  # registers the '3d' projection
+
+@jit(nopython=True, cache=True)
 def fractal_iter(c, z=0, ftype=0, max_iter=100):
     for n in range(max_iter):
         if abs(z) > 2: return n + 1 - np.log2(np.log2(abs(z)))
@@ -22,9 +34,10 @@ def fractal_iter(c, z=0, ftype=0, max_iter=100):
         elif ftype == 3: z = np.conj(z)**2 + c  # Tricorn
     return max_iter
 
-@jit(nopython=True, parallel=True)
-def compute_fractal(xmin, xmax, ymin, ymax, width, height, max_iter=100, 
-                   fractal_type=0, julia_c=complex(-0.7, 0.27015)):
+@jit(nopython=True, cache=True)
+def compute_fractal_reference(xmin, xmax, ymin, ymax, width, height, max_iter=100,
+                              fractal_type=0, julia_c=complex(-0.7, 0.27015)):
+    # Original per-pixel loop through fractal_iter; kept to validate and benchmark the kernel engine against
     x, y = np.linspace(xmin, xmax, width), np.linspace(ymin, ymax, height)
     result = np.zeros((height, width))
     for i in range(height):
@@ -33,57 +46,1125 @@ def compute_fractal(xmin, xmax, ymin, ymax, width, height, max_iter=100,
             result[i, j] = fractal_iter(c, z, fractal_type, max_iter)
     return result
 
-@jit(nopython=True)
-def create_distance_estimation(data, xmin, xmax, ymin, ymax):
-    h, w = data.shape; dx, dy = (xmax - xmin) / w, (ymax - ymin) / h; edges = np.zeros_like(data)
-    for i in range(1, h-1):
-        for j in range(1, w-1):
-            gx, gy = (data[i, j+1] - data[i, j-1]) / (2*dx), (data[i+1, j] - data[i-1, j]) / (2*dy)
-            edges[i, j] = np.sqrt(gx**2 + gy**2)
-    return edges
-
-try: @cuda.jit; GPU_AVAILABLE = True
-except: GPU_AVAILABLE = False
-
-@jit(nopython=True)
-def compute_fractal_3d(xmin, xmax, ymin, ymax, width, height, max_iter=100):
+# ---- Kernel engine: one specialised, row-parallel kernel per fractal type ----
+# Each kernel works on real/imag parts with a squared-magnitude escape test and is compiled separately for
+# float32 and float64 grids. Literals are avoided in the recurrences so float32 inputs stay float32.
+
+@jit(nopython=True, cache=True)
+def _smooth_escape(n, zr, zi): return n + 1 - np.log2(np.log2(abs(complex(zr, zi))))
+
+@jit(nopython=True, cache=True)
+def _in_cardioid_or_bulb(cr, ci):
+    # Analytic membership tests for the Mandelbrot main cardioid and period-2 bulb
+    xq, ci2 = cr - 0.25, ci*ci; q = xq*xq + ci2
+    return q * (q + xq) < 0.25 * ci2 or (cr + 1) * (cr + 1) + ci2 < 0.0625
+
+# Brent-style periodicity check: the orbit is compared against a saved point that is refreshed at power-of-two
+# intervals, so cycles of any length are caught. With periodicity_tol=0 only exactly repeating float orbits are
+# cut short, which can never escape, so output is identical to plain iteration.
+
+@jit(nopython=True, cache=True)
+def _quadratic_point(zr, zi, cr, ci, max_iter, periodicity, periodicity_tol):
+    sr, si, steps, limit = zr, zi, 0, 8
+    for n in range(max_iter):
+        zr2, zi2 = zr*zr, zi*zi
+        if zr2 + zi2 > 4: return _smooth_escape(n, zr, zi)
+        t = zr*zi; zi = t + t + ci; zr = zr2 - zi2 + cr
+        if periodicity:
+            if abs(zr - sr) <= periodicity_tol and abs(zi - si) <= periodicity_tol: return max_iter
+            steps += 1
+            if steps == limit: sr, si, steps, limit = zr, zi, 0, limit * 2
+    return max_iter
+
+@jit(nopython=True, cache=True)
+def _burning_ship_point(zr, zi, cr, ci, max_iter, periodicity, periodicity_tol):
+    sr, si, steps, limit = zr, zi, 0, 8
+    for n in range(max_iter):
+        zr2, zi2 = zr*zr, zi*zi
+        if zr2 + zi2 > 4: return _smooth_escape(n, zr, zi)
+        t = abs(zr)*abs(zi); zi = t + t + ci; zr = zr2 - zi2 + cr
+        if periodicity:
+            if abs(zr - sr) <= periodicity_tol and abs(zi - si) <= periodicity_tol: return max_iter
+            steps += 1
+            if steps == limit: sr, si, steps, limit = zr, zi, 0, limit * 2
+    return max_iter
+
+@jit(nopython=True, cache=True)
+def _tricorn_point(zr, zi, cr, ci, max_iter, periodicity, periodicity_tol):
+    sr, si, steps, limit = zr, zi, 0, 8
+    for n in range(max_iter):
+        zr2, zi2 = zr*zr, zi*zi
+        if zr2 + zi2 > 4: return _smooth_escape(n, zr, zi)
+        t = zr*zi; zi = ci - (t + t); zr = zr2 - zi2 + cr
+        if periodicity:
+            if abs(zr - sr) <= periodicity_tol and abs(zi - si) <= periodicity_tol: return max_iter
+            steps += 1
+            if steps == limit: sr, si, steps, limit = zr, zi, 0, limit * 2
+    return max_iter
+
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
+def _mandelbrot_kernel(x, y, cr, ci, max_iter, interior_check, periodicity, periodicity_tol, out):
+    zero = x[0] - x[0]
+    for i in prange(y.shape[0]):
+        for j in range(x.shape[0]):
+            if interior_check and _in_cardioid_or_bulb(x[j], y[i]): out[i, j] = max_iter
+            else: out[i, j] = _quadratic_point(zero, zero, x[j], y[i], max_iter, periodicity, periodicity_tol)
+
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
+def _julia_kernel(x, y, cr, ci, max_iter, interior_check, periodicity, periodicity_tol, out):
+    for i in prange(y.shape[0]):
+        for j in range(x.shape[0]): out[i, j] = _quadratic_point(x[j], y[i], cr, ci, max_iter, periodicity, periodicity_tol)
+
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
+def _burning_ship_kernel(x, y, cr, ci, max_iter, interior_check, periodicity, periodicity_tol, out):
+    zero = x[0] - x[0]
+    for i in prange(y.shape[0]):
+        for j in range(x.shape[0]): out[i, j] = _burning_ship_point(zero, zero, x[j], y[i], max_iter, periodicity, periodicity_tol)
+
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
+def _tricorn_kernel(x, y, cr, ci, max_iter, interior_check, periodicity, periodicity_tol, out):
+    zero = x[0] - x[0]
+    for i in prange(y.shape[0]):
+        for j in range(x.shape[0]): out[i, j] = _tricorn_point(zero, zero, x[j], y[i], max_iter, periodicity, periodicity_tol)
+
+FRACTAL_KERNELS = (_mandelbrot_kernel, _julia_kernel, _burning_ship_kernel, _tricorn_kernel)
+
+def compute_fractal_grid(x, y, max_iter=100, fractal_type=0, julia_c=complex(-0.7, 0.27015), out=None,
+                         interior_check=True, periodicity=True, periodicity_tol=0.0):
+    # interior_check (Mandelbrot only) and periodicity can be switched off to A/B the accelerations
+    dtype = x.dtype
+    if out is None: out = np.empty((len(y), len(x)), dtype=dtype)
+    FRACTAL_KERNELS[fractal_type](x, y, dtype.type(julia_c.real), dtype.type(julia_c.imag), int(max_iter),
+                                  bool(interior_check), bool(periodicity), float(periodicity_tol), out)
+    return out
+
+def compute_fractal(xmin, xmax, ymin, ymax, width, height, max_iter=100,
+                    fractal_type=0, julia_c=complex(-0.7, 0.27015), dtype=np.float64,
+                    interior_check=True, periodicity=True, periodicity_tol=0.0):
+    x, y = np.linspace(xmin, xmax, width).astype(dtype), np.linspace(ymin, ymax, height).astype(dtype)
+    return compute_fractal_grid(x, y, max_iter, fractal_type, julia_c, None, interior_check, periodicity, periodicity_tol)
+
+# ---- Mariani-Silver subdivision: rectangles whose whole border shares one value are filled without iterating ----
+
+@jit(nopython=True, cache=True)
+def _fractal_point(fractal_type, px, py, cr, ci, max_iter, interior_check, periodicity, periodicity_tol):
+    zero = px - px
+    if fractal_type == 1: return _quadratic_point(px, py, cr, ci, max_iter, periodicity, periodicity_tol)
+    if fractal_type == 2: return _burning_ship_point(zero, zero, px, py, max_iter, periodicity, periodicity_tol)
+    if fractal_type == 3: return _tricorn_point(zero, zero, px, py, max_iter, periodicity, periodicity_tol)
+    if interior_check and _in_cardioid_or_bulb(px, py): return float(max_iter)
+    return _quadratic_point(zero, zero, px, py, max_iter, periodicity, periodicity_tol)
+
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
+def _subdivide_kernel(x, y, fractal_type, cr, ci, max_iter, interior_check, periodicity, periodicity_tol, block, min_size, out):
+    h, w = out.shape; nby, nbx = (h + block - 1) // block, (w + block - 1) // block
+    skipped = np.zeros(nby * nbx, dtype=np.int64)
+    for b in prange(nby * nbx):
+        y0, x0 = (b // nbx) * block, (b % nbx) * block
+        y1, x1 = min(h, y0 + block) - 1, min(w, x0 + block) - 1
+        for i in range(y0, y1 + 1):
+            for j in (x0, x1): out[i, j] = _fractal_point(fractal_type, x[j], y[i], cr, ci, max_iter, interior_check, periodicity, periodicity_tol)
+        for j in range(x0 + 1, x1):
+            for i in (y0, y1): out[i, j] = _fractal_point(fractal_type, x[j], y[i], cr, ci, max_iter, interior_check, periodicity, periodicity_tol)
+        # Inclusive rectangles whose borders are already computed; children share the split row/column
+        stack = np.empty((4 * block, 4), dtype=np.int64); stack[0] = (y0, y1, x0, x1); top = 1
+        while top > 0:
+            top -= 1; ry0, ry1, rx0, rx1 = stack[top]
+            if ry1 - ry0 < 2 or rx1 - rx0 < 2: continue
+            v, uniform = out[ry0, rx0], True
+            for j in range(rx0, rx1 + 1):
+                if out[ry0, j] != v or out[ry1, j] != v: uniform = False; break
+            if uniform:
+                for i in range(ry0 + 1, ry1):
+                    if out[i, rx0] != v or out[i, rx1] != v: uniform = False; break
+            if uniform:
+                out[ry0 + 1:ry1, rx0 + 1:rx1] = v; skipped[b] += (ry1 - ry0 - 1) * (rx1 - rx0 - 1)
+            elif ry1 - ry0 <= min_size or rx1 - rx0 <= min_size:
+                for i in range(ry0 + 1, ry1):
+                    for j in range(rx0 + 1, rx1): out[i, j] = _fractal_point(fractal_type, x[j], y[i], cr, ci, max_iter, interior_check, periodicity, periodicity_tol)
+            else:
+                ym, xm = (ry0 + ry1) // 2, (rx0 + rx1) // 2
+                for j in range(rx0 + 1, rx1): out[ym, j] = _fractal_point(fractal_type, x[j], y[ym], cr, ci, max_iter, interior_check, periodicity, periodicity_tol)
+                for i in range(ry0 + 1, ry1):
+                    if i != ym: out[i, xm] = _fractal_point(fractal_type, x[xm], y[i], cr, ci, max_iter, interior_check, periodicity, periodicity_tol)
+                stack[top] = (ry0, ym, rx0, xm); stack[top + 1] = (ry0, ym, xm, rx1)
+                stack[top + 2] = (ym, ry1, rx0, xm); stack[top + 3] = (ym, ry1, xm, rx1); top += 4
+    return skipped.sum()
+
+def compute_fractal_subdivided(xmin, xmax, ymin, ymax, width, height, max_iter=100,
+                               fractal_type=0, julia_c=complex(-0.7, 0.27015), dtype=np.float64,
+                               interior_check=True, periodicity=True, periodicity_tol=0.0, block=64, min_size=4, cancelled=None):
+    # Returns (result, skipped) where skipped counts pixels filled from a uniform border instead of iterated.
+    # Rows are rendered in bands so `cancelled` can abandon the frame (returning None) between bands; each band spans
+    # enough block-rows to give every numba thread at least one block
+    x, y = np.linspace(xmin, xmax, width).astype(dtype), np.linspace(ymin, ymax, height).astype(dtype)
+    out, skipped = np.empty((height, width), dtype=dtype), 0
+    band = block * -(-numba.get_num_threads() // -(-width // block)) if cancelled else height
+    for r0 in range(0, height, band):
+        if cancelled and cancelled(): return None
+        skipped += _subdivide_kernel(x, y[r0:r0 + band], fractal_type, dtype(julia_c.real), dtype(julia_c.imag), int(max_iter), bool(interior_check),
+                                     bool(periodicity), float(periodicity_tol), int(block), int(min_size), out[r0:r0 + band])
+    return out, int(skipped)
+
+# ---- Perturbation deep zoom: one arbitrary-precision reference orbit, float64 deltas for every other pixel ----
+
+def reference_orbit(center_x, center_y, max_iter, fractal_type=0, julia_c=complex(-0.7, 0.27015), digits=40):
+    # Iterates the view centre in Decimal arithmetic; the orbit is stored rounded to complex128 and ends at escape
+    with decimal.localcontext() as ctx:
+        ctx.prec = digits
+        cx, cy = Decimal(center_x), Decimal(center_y)
+        if fractal_type == 1: zr, zi, cr, ci = cx, cy, Decimal(julia_c.real), Decimal(julia_c.imag)
+        else: zr, zi, cr, ci = Decimal(0), Decimal(0), cx, cy
+        orbit = np.empty(max_iter + 1, dtype=np.complex128)
+        for n in range(max_iter + 1):
+            orbit[n] = complex(float(zr), float(zi))
+            zr2, zi2 = zr*zr, zi*zi
+            if zr2 + zi2 > 4: return orbit[:n + 1]
+            t = abs(zr*zi) if fractal_type == 2 else zr*zi
+            zi = ci - 2*t if fractal_type == 3 else 2*t + ci; zr = zr2 - zi2 + cr
+    return orbit
+
+@jit(nopython=True, cache=True)
+def _series_approximation(orbit, radius, tol):
+    # Mandelbrot delta_n ~ a*dc + b*dc^2 + c*dc^3; the quartic coefficient d estimates the truncation error and the
+    # skip stops once that error is no longer negligible against the linear term anywhere in the view
+    a, b, c, d, n = 0j, 0j, 0j, 0j, 0
+    while n < len(orbit) - 2:
+        z = orbit[n]; na, nb, nc, nd = 2*z*a + 1, 2*z*b + a*a, 2*z*c + 2*a*b, 2*z*d + 2*a*c + b*b
+        if abs(nd) * radius**3 >= tol * abs(na): break
+        a, b, c, d, n = na, nb, nc, nd, n + 1
+    return n, a, b, c
+
+@jit(nopython=True, cache=True)
+def _diffabs(c, d):
+    # |c + d| - |c| without cancellation, for Burning Ship perturbation
+    if c >= 0: return d if c + d >= 0 else -(2*c + d)
+    return -d if c + d <= 0 else 2*c + d
+
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
+def _perturbation_kernel(dx, dy, orbit, fractal_type, max_iter, skip, sa, sb, sc, out):
+    last, z0r, z0i = len(orbit) - 1, orbit[0].real, orbit[0].imag
+    for i in prange(len(dy)):
+        for j in range(len(dx)):
+            if fractal_type == 1: dcr, dci, dr, di = 0.0, 0.0, dx[j], dy[i]
+            else: dcr, dci, dr, di = dx[j], dy[i], 0.0, 0.0
+            n = m = 0
+            if skip > 0:
+                d = complex(dx[j], dy[i]); s = (sa + (sb + sc*d)*d)*d; dr, di, n, m = s.real, s.imag, skip, skip
+            out[i, j] = max_iter
+            while n < max_iter:
+                zr, zi = orbit[m].real, orbit[m].imag
+                if (zr + dr)**2 + (zi + di)**2 > 4: out[i, j] = _smooth_escape(n, zr + dr, zi + di); break
+                if fractal_type == 2:
+                    nr = (2*zr + dr)*dr - (2*zi + di)*di + dcr
+                    di = 2*_diffabs(zr*zi, zr*di + dr*zi + dr*di) + dci; dr = nr
+                else:
+                    nr, ni = 2*(zr*dr - zi*di) + dr*dr - di*di, 2*(zr*di + zi*dr + dr*di)
+                    dr, di = nr + dcr, (-ni if fractal_type == 3 else ni) + dci
+                n += 1; m += 1
+                # Glitch check: once |Z + dz| < |dz| (or the reference has escaped) the delta has lost its precision
+                # advantage, so rebase the pixel onto the start of the reference orbit
+                zr, zi = orbit[m].real + dr, orbit[m].imag + di
+                if m == last or zr*zr + zi*zi < dr*dr + di*di: dr, di, m = zr - z0r, zi - z0i, 0
+
+def compute_fractal_perturbation(center_x, center_y, span_x, span_y, width, height, max_iter=100, fractal_type=0,
+                                 julia_c=complex(-0.7, 0.27015), series=True, series_tol=1e-12, cancelled=None, band=32):
+    # Deep-zoom renderer on the same pixel grid as compute_fractal, with the view given as a Decimal centre and spans
+    center_x, center_y = Decimal(center_x), Decimal(center_y)
+    digits = max(30, int(-math.log10(min(span_x / width, span_y / height))) + 20)
+    orbit = reference_orbit(center_x, center_y, max_iter, fractal_type, julia_c, digits)
+    if len(orbit) < 2:  # the centre escapes immediately, so the view is not deep enough to need perturbation
+        cx, cy = float(center_x), float(center_y)
+        return compute_fractal(cx - span_x / 2, cx + span_x / 2, cy - span_y / 2, cy + span_y / 2, width, height, max_iter, fractal_type, julia_c)
+    dx = (np.arange(width) - (width - 1) / 2) * (span_x / max(width - 1, 1))
+    dy = (np.arange(height) - (height - 1) / 2) * (span_y / max(height - 1, 1))
+    skip, a, b, c = 0, 0j, 0j, 0j
+    if series and fractal_type == 0: skip, a, b, c = _series_approximation(orbit, math.hypot(span_x, span_y) / 2, series_tol)
+    out = np.empty((height, width))
+    for r0 in range(0, height, band):
+        if cancelled and cancelled(): return None
+        _perturbation_kernel(dx, dy[r0:r0 + band], orbit, fractal_type, int(max_iter), int(skip), a, b, c, out[r0:r0 + band])
+    return out
+
+# ---- Tiled rendering: square tiles on a slippy-map grid of zoom levels, kept in a memory-bounded LRU cache ----
+
+TILE_SIZE, TILE_LEVEL0_SPAN = 128, 4.0  # tile width in pixels, and in the complex plane at level 0
+
+class TileCache:
+    def __init__(self, max_bytes=256 * 2**20):
+        self.max_bytes, self.nbytes, self.hits, self.misses, self.tiles = max_bytes, 0, 0, 0, OrderedDict()
+    
+    def get(self, key):
+        tile = self.tiles.get(key)
+        if tile is None: self.misses += 1; return None
+        self.hits += 1; self.tiles.move_to_end(key)
+        return tile
+    
+    def put(self, key, tile):
+        if key in self.tiles: self.nbytes -= self.tiles.pop(key).nbytes
+        self.tiles[key] = tile; self.nbytes += tile.nbytes
+        while self.nbytes > self.max_bytes and len(self.tiles) > 1:
+            self.nbytes -= self.tiles.popitem(last=False)[1].nbytes
+    
+    def clear(self): self.tiles.clear(); self.nbytes = 0
+    
+    def stats(self): return dict(hits=self.hits, misses=self.misses, tiles=len(self.tiles), nbytes=self.nbytes)
+
+def render_tiled(cache, xmin, xmax, ymin, ymax, width, height, max_iter=100, fractal_type=0, julia_c=complex(-0.7, 0.27015), cancelled=None):
+    # The level whose tile pixels are closest to the finer view axis is used, and each view pixel takes the tile
+    # pixel it falls in, so tiles computed for one view are reused by every pan and revisit at similar zoom
+    spacing = min((xmax - xmin) / max(width - 1, 1), (ymax - ymin) / max(height - 1, 1))
+    level = max(0, round(math.log2(TILE_LEVEL0_SPAN / (TILE_SIZE * spacing))))
+    step = TILE_LEVEL0_SPAN / 2**level / TILE_SIZE
+    gx, gy = np.floor(np.linspace(xmin, xmax, width) / step).astype(np.int64), np.floor(np.linspace(ymin, ymax, height) / step).astype(np.int64)
+    out = np.empty((height, width))
+    for ty in np.unique(gy // TILE_SIZE):
+        rows = np.nonzero(gy // TILE_SIZE == ty)[0]
+        for tx in np.unique(gx // TILE_SIZE):
+            cols = np.nonzero(gx // TILE_SIZE == tx)[0]
+            key = (fractal_type, julia_c if fractal_type == 1 else None, max_iter, level, int(tx), int(ty))
+            tile = cache.get(key)
+            if tile is None:
+                if cancelled and cancelled(): return None
+                offsets = (np.arange(TILE_SIZE) + 0.5) * step
+                tile = compute_fractal_grid(tx * TILE_SIZE * step + offsets, ty * TILE_SIZE * step + offsets, max_iter, fractal_type, julia_c)
+                cache.put(key, tile)
+            out[np.ix_(rows, cols)] = tile[np.ix_(gy[rows] % TILE_SIZE, gx[cols] % TILE_SIZE)]
+    return out
+
+# ---- Incremental refinement: raising max_iter resumes the stored orbits of pixels that have not escaped ----
+
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
+def _resume_kernel(px, py, zr, zi, n_done, stop, fractal_type, cr, ci, periodicity, periodicity_tol, escape_n, smooth):
+    # Same recurrences as the per-type point functions, run over compact arrays of still-active pixels
+    for k in prange(len(px)):
+        if escape_n[k] != -1: continue
+        kcr, kci = (cr, ci) if fractal_type == 1 else (px[k], py[k])
+        r, i = zr[k], zi[k]; sr, si, steps, limit = r, i, 0, 8
+        for n in range(n_done[k], stop):
+            r2, i2 = r*r, i*i
+            if r2 + i2 > 4: escape_n[k] = n; smooth[k] = _smooth_escape(n, r, i); break
+            t = abs(r)*abs(i) if fractal_type == 2 else r*i
+            i = kci - (t + t) if fractal_type == 3 else t + t + kci; r = r2 - i2 + kcr
+            if periodicity:
+                if abs(r - sr) <= periodicity_tol and abs(i - si) <= periodicity_tol: escape_n[k] = -2; break
+                steps += 1
+                if steps == limit: sr, si, steps, limit = r, i, 0, limit * 2
+        zr[k], zi[k], n_done[k] = r, i, max(n_done[k], stop)
+
+class IncrementalRender:
+    # Per-pixel escape iteration (-1 still iterating, -2 proven interior) and smooth value, plus z and the iteration
+    # reached for pixels still iterating; results are identical to compute_fractal for any max_iter
+    def __init__(self, xmin, xmax, ymin, ymax, width, height, fractal_type=0, julia_c=complex(-0.7, 0.27015),
+                 interior_check=True, periodicity=True, periodicity_tol=0.0):
+        self.key = (xmin, xmax, ymin, ymax, width, height, fractal_type, julia_c if fractal_type == 1 else None)
+        self.shape, self.fractal_type, self.julia_c = (height, width), fractal_type, julia_c
+        self.periodicity, self.periodicity_tol = periodicity, periodicity_tol
+        px, py = np.meshgrid(np.linspace(xmin, xmax, width), np.linspace(ymin, ymax, height))
+        self.escape_n, self.smooth = np.full(width * height, -1, dtype=np.int32), np.zeros(width * height)
+        if fractal_type == 0 and interior_check:
+            xq = px.ravel() - 0.25; q = xq*xq + py.ravel()**2
+            inside = (q * (q + xq) < 0.25 * py.ravel()**2) | ((px.ravel() + 1)**2 + py.ravel()**2 < 0.0625)
+            self.escape_n[inside] = -2
+        self.active = np.nonzero(self.escape_n == -1)[0]
+        self.px, self.py = px.ravel()[self.active], py.ravel()[self.active]
+        self.zr, self.zi = (self.px.copy(), self.py.copy()) if fractal_type == 1 else (np.zeros(len(self.active)), np.zeros(len(self.active)))
+        self.n_done = np.zeros(len(self.active), dtype=np.int64)
+    
+    def render(self, max_iter, cancelled=None, chunk=65536):
+        # Active pixels are advanced chunk by chunk; if `cancelled` fires the progress made so far is kept and None returned
+        for k0 in range(0, len(self.active), chunk):
+            sl = slice(k0, k0 + chunk)
+            if self.n_done[sl].min() >= max_iter: continue
+            if cancelled and cancelled(): return None
+            escape_n, smooth = self.escape_n[self.active[sl]], self.smooth[self.active[sl]]
+            _resume_kernel(self.px[sl], self.py[sl], self.zr[sl], self.zi[sl], self.n_done[sl], int(max_iter), self.fractal_type,
+                           self.julia_c.real, self.julia_c.imag, self.periodicity, float(self.periodicity_tol), escape_n, smooth)
+            self.escape_n[self.active[sl]], self.smooth[self.active[sl]] = escape_n, smooth
+        keep = self.escape_n[self.active] == -1
+        self.active, self.px, self.py, self.zr, self.zi, self.n_done = (a[keep] for a in (self.active, self.px, self.py, self.zr, self.zi, self.n_done))
+        escaped = (self.escape_n >= 0) & (self.escape_n < max_iter)
+        return np.where(escaped, self.smooth, float(max_iter)).reshape(self.shape)
+
+# ---- Distance estimation: the orbit derivative dz/dc is carried through the iteration loop ----
+
+@jit(nopython=True, cache=True)
+def _distance_step(fractal_type, zr, zi, zr2, zi2, cr, ci, dr, di):
+    # One step of z and its derivative, with z updated exactly as in the *_point functions
+    if fractal_type == 2:
+        # Burning Ship is not holomorphic, so only the bound |dz| -> 2|z||dz| + 1 is tracked (kept in dr)
+        t = abs(zr)*abs(zi); return zr2 - zi2 + cr, t + t + ci, 2 * math.sqrt(zr2 + zi2) * dr + 1, 0.0
+    if fractal_type == 3:
+        t = zr*zi; return zr2 - zi2 + cr, ci - (t + t), 2 * (zr*dr - zi*di) + 1, -2 * (zr*di + zi*dr)
+    t = zr*zi; one = 1.0 if fractal_type == 0 else 0.0
+    return zr2 - zi2 + cr, t + t + ci, 2 * (zr*dr - zi*di) + one, 2 * (zr*di + zi*dr)
+
+@jit(nopython=True, cache=True)
+def _distance_point(fractal_type, zr, zi, cr, ci, dr, di, max_iter, periodicity, periodicity_tol):
+    # Returns (smooth count, distance estimate, log|z| at escape); the smooth count is identical to the plain
+    # kernels. Escaped orbits run on to a large bailout first, which the estimate needs but the count must not see
+    sr, si, steps, limit, n = zr, zi, 0, 8, 0
+    while True:
+        if n == max_iter: return float(max_iter), 0.0, 0.0
+        zr2, zi2 = zr*zr, zi*zi
+        if zr2 + zi2 > 4: break
+        zr, zi, dr, di = _distance_step(fractal_type, zr, zi, zr2, zi2, cr, ci, dr, di); n += 1
+        if periodicity:
+            if abs(zr - sr) <= periodicity_tol and abs(zi - si) <= periodicity_tol: return float(max_iter), 0.0, 0.0
+            steps += 1
+            if steps == limit: sr, si, steps, limit = zr, zi, 0, limit * 2
+    smooth, height = _smooth_escape(n, zr, zi), 0.5 * math.log(zr2 + zi2)
+    for _ in range(16):
+        zr2, zi2 = zr*zr, zi*zi
+        if zr2 + zi2 > 1e8: break
+        zr, zi, dr, di = _distance_step(fractal_type, zr, zi, zr2, zi2, cr, ci, dr, di)
+    r, d = math.sqrt(zr*zr + zi*zi), math.sqrt(dr*dr + di*di)
+    return smooth, (0.5 * r * math.log(r) / d if d > 0 else 0.0), height
+
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
+def _distance_kernel(x, y, fractal_type, cr, ci, max_iter, interior_check, periodicity, periodicity_tol, out, dist, heights):
+    for i in prange(y.shape[0]):
+        for j in range(x.shape[0]):
+            if fractal_type == 1: s, d, h = _distance_point(1, x[j], y[i], cr, ci, 1.0, 0.0, max_iter, periodicity, periodicity_tol)
+            elif fractal_type == 0 and interior_check and _in_cardioid_or_bulb(x[j], y[i]): s, d, h = float(max_iter), 0.0, 0.0
+            else: s, d, h = _distance_point(fractal_type, 0.0, 0.0, x[j], y[i], 0.0, 0.0, max_iter, periodicity, periodicity_tol)
+            out[i, j] = s; dist[i, j] = d; heights[i, j] = h
+
+def compute_fractal_distance(xmin, xmax, ymin, ymax, width, height, max_iter=100, fractal_type=0,
+                             julia_c=complex(-0.7, 0.27015), interior_check=True, periodicity=True, periodicity_tol=0.0,
+                             cancelled=None, band=32):
+    # Single pass returning the smooth counts (same as compute_fractal), the exterior distance estimate
+    # 0.5·|z|·ln|z|/|dz/dc| in complex-plane units (0 inside the set) and the log|z| escape heights.
+    # With `cancelled`, rows go in bands and None is returned once it reports the render obsolete
     x, y = np.linspace(xmin, xmax, width), np.linspace(ymin, ymax, height)
-    result, heights = np.zeros((height, width)), np.zeros((height, width))
-    for i in range(height):
-        for j in range(width):
-            c, z = complex(x[j], y[i]), 0
-            for n in range(max_iter):
-                if abs(z) > 2: result[i, j] = n + 1 - np.log2(np.log2(abs(z))); heights[i, j] = np.log(abs(z)); break
-                z = z*z + c
-            else: result[i, j], heights[i, j] = max_iter, 0
-    return result, heights
-
-def detect_interesting_regions(data, num_regions=5):
+    out, dist, heights = np.empty((height, width)), np.empty((height, width)), np.empty((height, width))
+    band = band if cancelled else height
+    for r0 in range(0, height, band):
+        if cancelled and cancelled(): return None
+        _distance_kernel(x, y[r0:r0 + band], fractal_type, julia_c.real, julia_c.imag, int(max_iter), bool(interior_check),
+                         bool(periodicity), float(periodicity_tol), out[r0:r0 + band], dist[r0:r0 + band], heights[r0:r0 + band])
+    return out, dist, heights
+
+def distance_edges(dist, pixel):
+    # Edge strength in place: pixel size over distance, 1 within a pixel of the boundary, 0 inside the set
+    np.divide(pixel, dist, out=dist, where=dist > 0); np.minimum(dist, 1.0, out=dist)
+    return dist
+
+def create_distance_estimation(data, xmin, xmax, ymin, ymax):
+    # Gradient magnitude of the smooth-count field, for renders without a derivative (perturbation deep zooms)
+    h, w = data.shape
+    gy, gx = np.gradient(data, (ymax - ymin) / max(h - 1, 1), (xmax - xmin) / max(w - 1, 1))
+    np.hypot(gx, gy, out=gx); return gx
+
+_gpu_available = None
+
+def gpu_available():
+    # Probing CUDA imports numba.cuda and may load the driver, so it only happens when something asks
+    global _gpu_available
+    if _gpu_available is None:
+        try:
+            from numba import cuda
+            _gpu_available = bool(cuda.is_available())
+        except Exception: _gpu_available = False
+    return _gpu_available
+
+def __getattr__(name):
+    if name == 'GPU_AVAILABLE': return gpu_available()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def adaptive_mesh_indices(data, budget=4800, floor=0.3):
+    # Rows and columns for a rectilinear mesh of about `budget` vertices, placed by the inverse CDF of the summed
+    # gradient along each axis so steep regions get denser vertices; `floor` keeps a uniform share for flat areas
+    h, w = data.shape
+    ny = max(2, min(h, round(math.sqrt(budget * h / w)))); nx = max(2, min(w, budget // ny))
+    def pick(gradient, n):
+        total = gradient.sum(); density = (1 - floor) * (gradient / total if total > 0 else 1 / len(gradient)) + floor / len(gradient)
+        cdf = np.concatenate(([0.0], np.cumsum(density))); cdf /= cdf[-1]
+        return np.unique(np.searchsorted(cdf, np.linspace(0, 1, n)))
+    return pick(np.abs(np.diff(data, axis=0)).sum(1), ny), pick(np.abs(np.diff(data, axis=1)).sum(0), nx)
+
+def surface_quads(X, Y, Z):
+    # (cells, 4, 3) polygons in the corner order plot_surface uses, plus each cell's mean height for colouring
+    P = np.stack((X, Y, Z), axis=-1)
+    quads = np.stack((P[:-1, :-1], P[:-1, 1:], P[1:, 1:], P[1:, :-1]), axis=2).reshape(-1, 4, 3)
+    return quads, quads[..., 2].mean(axis=1)
+
+def compute_fractal_3d(xmin, xmax, ymin, ymax, width, height, max_iter=100, fractal_type=0, julia_c=complex(-0.7, 0.27015)):
+    data, _, heights = compute_fractal_distance(xmin, xmax, ymin, ymax, width, height, max_iter, fractal_type, julia_c)
+    return data, heights
+
+REGION_SAMPLES, REGION_CELL = 256, 4  # pyramid level size (long side) and cell edge for block statistics
+
+def _region_scores(data):
+    # Mean gradient per REGION_CELL-square block of a strided pyramid level at most REGION_SAMPLES pixels a side,
+    # so the cost does not depend on the frame size; also returns the stride back to full-resolution pixels
+    step = max(1, -(-max(data.shape) // REGION_SAMPLES)); level = data[::step, ::step]
+    if min(level.shape) < 2: return None, step
+    grad = np.abs(np.diff(level, axis=0))[:, :-1] + np.abs(np.diff(level, axis=1))[:-1]
+    gh, gw = grad.shape[0] // REGION_CELL, grad.shape[1] // REGION_CELL
+    if gh == 0 or gw == 0: return None, step
+    return grad[:gh * REGION_CELL, :gw * REGION_CELL].reshape(gh, REGION_CELL, gw, REGION_CELL).mean(axis=(1, 3)), step
+
+def detect_interesting_regions(data, num_regions=5, method='peaks'):
+    # (x, y) pixel centres of high-detail areas, best first. 'peaks' takes the highest-scoring blocks with a minimum
+    # spacing of 1/8 of the grid; 'grid' joins the top-decile blocks into 8-connected clusters; 'dbscan' is the
+    # original per-pixel sklearn clustering, kept for comparison
+    if method == 'dbscan': return _detect_regions_dbscan(data, num_regions)
+    score, step = _region_scores(data)
+    if score is None: return []
+    h, w = data.shape; gh, gw = score.shape
+    to_pixels = lambda r, c: (min((c + 0.5) * REGION_CELL * step, w - 1), min((r + 0.5) * REGION_CELL * step, h - 1))
+    if method == 'peaks':
+        spacing, peaks = max(gh, gw) / 8, []
+        for k in np.argsort(score, axis=None)[::-1]:
+            r, c = divmod(int(k), gw)
+            if score[r, c] <= 0 or (num_regions and len(peaks) == num_regions): break
+            if all((r - pr)**2 + (c - pc)**2 >= spacing**2 for pr, pc in peaks): peaks.append((r, c))
+        return [to_pixels(r, c) for r, c in peaks]
+    hot = score > np.percentile(score, 90)
+    clusters, seen = [], np.zeros_like(hot)
+    for i, j in zip(*np.nonzero(hot)):
+        if seen[i, j]: continue
+        seen[i, j], stack, cells = True, [(i, j)], []
+        while stack:
+            a, b = stack.pop(); cells.append((a, b))
+            for na in range(max(a - 1, 0), min(a + 2, gh)):
+                for nb in range(max(b - 1, 0), min(b + 2, gw)):
+                    if hot[na, nb] and not seen[na, nb]: seen[na, nb] = True; stack.append((na, nb))
+        rows, cols = np.array(cells).T; weight = score[rows, cols]
+        clusters.append((weight.sum(), to_pixels((rows * weight).sum() / weight.sum(), (cols * weight).sum() / weight.sum())))
+    clusters.sort(key=lambda c: -c[0])
+    return [centre for _, centre in clusters[:num_regions]]
+
+def _detect_regions_dbscan(data, num_regions=5):
     grad = np.gradient(data); grad_mag = np.sqrt(grad[0]**2 + grad[1]**2)
     pts = np.where(grad_mag > np.percentile(grad_mag, 95))
     if len(pts[0]) > 10:
+        from sklearn.cluster import DBSCAN
         points = np.column_stack(pts); clustering = DBSCAN(eps=20, min_samples=10).fit(points)
         regions = [(np.mean(points[clustering.labels_ == l][:, 1]), np.mean(points[clustering.labels_ == l][:, 0])) 
                   for l in set(clustering.labels_) if l != -1]
         return regions[:num_regions]
     return []
 
-def generate_fractal_music(data, duration=10, sample_rate=22050):
-    norm = (data.flatten() - data.min()) / (data.max() - data.min()); t = np.linspace(0, duration, int(duration * sample_rate))
-    freqs = 440 * (2 ** (norm[:len(t)] * 2)); audio = np.zeros_like(t)
-    for i, f in enumerate(freqs[:len(t)//10]):
-        audio[i:i+len(t)//10] += 0.1 * np.sin(2*np.pi*f*t[i:i+len(t)//10]) * np.exp(-t[i:i+len(t)//10]*0.1)
-    return audio, sample_rate
+# ---- Sonification: additive synthesis with a fixed voice bank, produced in chunks so playback can stream ----
+
+class FractalSonifier:
+    # The view is swept left to right over `duration` seconds. Each voice follows one horizontal band of rows: its
+    # pitch rises over `octaves` above `base_freq` with the band's mean escape count, and its loudness is the band's
+    # escaped share, so the set's interior is silent. Controls are interpolated per sample and phases carry over
+    # between chunks, so output is click-free at any chunk size. set_data() may be called while playing
+    def __init__(self, data=None, max_iter=None, duration=5.0, sample_rate=22050, voices=24, chunk=1024,
+                 base_freq=110.0, octaves=4.0, loop=False, columns=512):
+        self.duration, self.sample_rate, self.voices, self.chunk = duration, sample_rate, voices, chunk
+        self.base_freq, self.octaves, self.loop, self.columns = base_freq, octaves, loop, columns
+        self.position, self.phase, self.controls, self.stream = 0, np.zeros(voices), None, None
+        if data is not None: self.set_data(data, max_iter)
+    
+    total = property(lambda self: int(round(self.duration * self.sample_rate)))
+    done = property(lambda self: not self.loop and self.position >= self.total)
+    
+    def set_data(self, data, max_iter=None):
+        # Bands and columns are averaged with reduceat, so this stays a few ms even for full-size views
+        data = np.asarray(data, np.float64); h, w = data.shape
+        interior = data.max() if max_iter is None else max_iter
+        escaped = data < interior; lo = data[escaped].min() if escaped.any() else 0.0
+        level = np.where(escaped, (data - lo) / max(interior - lo, 1e-12), 0.0)
+        rows = np.linspace(0, h, min(self.voices, h) + 1).astype(np.int64)[:-1]
+        cols = np.linspace(0, w, min(self.columns, w) + 1).astype(np.int64)[:-1]
+        cells = np.diff(np.append(rows, h))[:, None] * np.diff(np.append(cols, w))[None, :]
+        amp = np.add.reduceat(np.add.reduceat(escaped.astype(np.float64), rows, 0), cols, 1) / cells
+        mean = np.add.reduceat(np.add.reduceat(level, rows, 0), cols, 1) / cells / np.maximum(amp, 1e-12)
+        if len(rows) < self.voices:  # fewer rows than voices: the extra voices stay silent
+            pad = ((0, self.voices - len(rows)), (0, 0)); amp, mean = np.pad(amp, pad), np.pad(mean, pad)
+        # Bottom band is the lowest voice, spread over the range so bands stay apart when their counts are equal
+        spread = np.arange(self.voices)[:, None] / self.voices
+        freq = self.base_freq * 2 ** (self.octaves * (0.5 * spread + 0.5 * np.sqrt(mean)))
+        self.controls = (freq, amp)  # swapped in one assignment, so a playing stream sees old or new, never a mix
+    
+    def synthesize(self, n):
+        # Next n samples as float32; past the end of a non-looping sweep the rest is zeros
+        freq, amp = self.controls; total = self.total
+        index = self.position + np.arange(n); self.position += n
+        x = (index % total if self.loop else np.minimum(index, total - 1)) * ((freq.shape[1] - 1) / max(total - 1, 1))
+        i0 = np.minimum(x.astype(np.int64), freq.shape[1] - 2) if freq.shape[1] > 1 else np.zeros(n, np.int64)
+        t = x - i0 if freq.shape[1] > 1 else np.zeros(n); i1 = np.minimum(i0 + 1, freq.shape[1] - 1)
+        f = freq[:, i0] * (1 - t) + freq[:, i1] * t; a = amp[:, i0] * (1 - t) + amp[:, i1] * t
+        phase = self.phase[:, None] + np.cumsum(f, axis=1) * (2 * np.pi / self.sample_rate)
+        self.phase = phase[:, -1] % (2 * np.pi)
+        mix = np.tanh(np.einsum('vn,vn->n', a, np.sin(phase)) * (0.6 / np.sqrt(self.voices)))
+        fade = int(0.01 * self.sample_rate)  # 10 ms ramps at the start and end of the sweep
+        mix *= np.clip(np.minimum(index + 1, total - index if not self.loop else fade) / fade, 0, 1)
+        return mix.astype(np.float32)
+    
+    def chunks(self):
+        while not self.done: yield self.synthesize(self.chunk if self.loop else min(self.chunk, self.total - self.position))
+    
+    def render(self):
+        self.position = 0; self.phase[:] = 0
+        return np.concatenate(list(self.chunks())) if self.total else np.zeros(0, np.float32)
+    
+    def write_wav(self, filename):
+        # 16-bit mono WAV written chunk by chunk; needs no audio device
+        import wave
+        self.position = 0; self.phase[:] = 0
+        with wave.open(filename, 'wb') as f:
+            f.setnchannels(1); f.setsampwidth(2); f.setframerate(self.sample_rate)
+            for chunk in self.chunks(): f.writeframes((chunk * 32767).astype('<i2').tobytes())
+        return filename
+    
+    def play(self):
+        # Starts a sounddevice callback stream, which pulls chunks as the device needs them
+        import sounddevice as sd
+        def callback(outdata, frames, time_info, status):
+            outdata[:, 0] = self.synthesize(frames)
+            if self.done: raise sd.CallbackStop
+        self.stop(); self.position = 0
+        self.stream = sd.OutputStream(samplerate=self.sample_rate, channels=1, dtype='float32', blocksize=self.chunk, callback=callback)
+        self.stream.start(); return self.stream
+    
+    def stop(self):
+        if self.stream is not None: self.stream.stop(); self.stream.close(); self.stream = None
+    
+    playing = property(lambda self: self.stream is not None and self.stream.active)
+
+def generate_fractal_music(data, duration=10, sample_rate=22050, max_iter=None):
+    return FractalSonifier(data, max_iter, duration, sample_rate).render(), sample_rate
+
+FRACTAL_NAMES = ['Mandelbrot', 'Julia', 'Burning Ship', 'Tricorn']
+DEFAULT_BOUNDS = [(-2.5, 1.5, -1.5, 1.5), (-2, 2, -2, 2), (-2.5, 1.5, -2.5, 1.5), (-2.5, 1.5, -1.5, 1.5)]
+DEEP_ZOOM_THRESHOLD = 1e-13  # pixel spacing relative to |c| below which views switch to perturbation
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv')
+
+def is_deep_view(center_x, center_y, span_x, span_y, width, height):
+    # float64 pixel grids turn blocky once the pixel spacing nears the precision of the coordinates
+    magnitude = max(1.0, abs(float(center_x)), abs(float(center_y)))
+    return min(span_x / width, span_y / height) < DEEP_ZOOM_THRESHOLD * magnitude
+
+def render_view(center_x, center_y, span_x, span_y, width, height, max_iter=100, fractal_type=0,
+                julia_c=complex(-0.7, 0.27015), series=True, cancelled=None):
+    # One-shot render of a centre/span view, switching to perturbation when float64 grids run out of precision
+    if is_deep_view(center_x, center_y, span_x, span_y, width, height):
+        return compute_fractal_perturbation(center_x, center_y, span_x, span_y, width, height, max_iter, fractal_type,
+                                            julia_c, series, cancelled=cancelled)
+    cx, cy = float(center_x), float(center_y)
+    return compute_fractal(cx - span_x / 2, cx + span_x / 2, cy - span_y / 2, cy + span_y / 2, width, height,
+                           max_iter, fractal_type, julia_c)
+
+COLORMAPS = ['hot', 'plasma', 'viridis', 'magma', 'inferno', 'cividis', 'rainbow', 'twilight', 'turbo', 'gist_ncar', 'nipy_spectral']
+COLOR_MODES = ['Linear', 'Histogram', 'Cyclic']
+LUT_SIZE, HISTOGRAM_BINS = 1024, 4096
+_luts = {}
+
+def colormap_lut(cmap, size=LUT_SIZE):
+    # uint8 RGB table sampled once per colormap from the registry (no pyplot needed)
+    if (cmap, size) not in _luts:
+        from matplotlib import colormaps
+        _luts[cmap, size] = np.ascontiguousarray(colormaps[cmap](np.linspace(0, 1, size), bytes=True)[:, :3])
+    return _luts[cmap, size]
+
+@jit(nopython=True, nogil=True, cache=True)
+def _histogram_kernel(data, lo, scale, interior, hist):
+    n = hist.shape[0]
+    for i in range(data.shape[0]):
+        for j in range(data.shape[1]):
+            v = data[i, j]
+            if v < interior: hist[min(max(int((v - lo) * scale), 0), n - 1)] += 1
+
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
+def _lut_kernel(data, lo, scale, cyclic, table, lut, interior, flip, out):
+    # bin -> table -> LUT row, so linear, histogram-equalised and cyclic colouring share one pass
+    h, w, n = data.shape[0], data.shape[1], table.shape[0]
+    for i in prange(h):
+        r = h - 1 - np.int64(i) if flip else np.int64(i)
+        for j in range(w):
+            v = data[i, j]
+            if v >= interior:
+                out[r, j, 0] = 0; out[r, j, 1] = 0; out[r, j, 2] = 0
+                continue
+            b = int((v - lo) * scale)
+            b = b % n if cyclic else min(max(b, 0), n - 1)
+            k = table[b]
+            out[r, j, 0] = lut[k, 0]; out[r, j, 1] = lut[k, 1]; out[r, j, 2] = lut[k, 2]
+
+class Colorizer:
+    # Maps smooth iteration counts to uint8 RGB through a precomputed colormap LUT. 'Linear' matches the old
+    # min-max normalisation, 'Histogram' equalises the escape-count distribution, 'Cyclic' repeats the palette
+    # every `cycle` iterations. Passing max_iter paints the interior black in the non-linear modes. Output and
+    # histogram buffers are kept per shape and reused, so steady-state colouring allocates nothing
+    def __init__(self, cmap='hot', mode='Linear', cycle=32.0):
+        self.cmap, self.mode, self.cycle = cmap, mode, cycle
+        self.hist, self.buffers = np.zeros(HISTOGRAM_BINS, np.int64), {}
+        self.identity = np.arange(LUT_SIZE, dtype=np.int32); self.equalised = np.zeros(HISTOGRAM_BINS, np.int32)
+    
+    def buffer(self, shape, flip):
+        key = (shape, flip)
+        if key not in self.buffers: self.buffers[key] = np.empty(shape + (3,), np.uint8)
+        return self.buffers[key]
+    
+    def interior_level(self, max_iter):
+        return np.inf if max_iter is None or self.mode == 'Linear' else float(max_iter)
+    
+    def histogram_scale(self, lo, hi, interior):
+        top = min(hi, interior); return HISTOGRAM_BINS / (top - lo) if top > lo else 0.0
+    
+    def accumulate(self, data, lo, hi, interior):
+        # Adds `data` to the equalisation histogram; callers colouring in strips accumulate every strip before painting
+        _histogram_kernel(data, lo, self.histogram_scale(lo, hi, interior), interior, self.hist)
+    
+    def __call__(self, data, max_iter=None, flip=True, out=None):
+        # flip=True puts row 0 at the top (image files); the explorer keeps origin='lower' and passes False.
+        # The returned buffer is reused by the next call of the same shape unless `out` is given
+        out = self.buffer(data.shape, flip) if out is None else out
+        lo, hi, interior = float(data.min()), float(data.max()), self.interior_level(max_iter)
+        if self.mode == 'Histogram': self.hist[:] = 0; self.accumulate(data, lo, hi, interior)
+        return self.paint(data, lo, hi, interior, flip, out)
+    
+    def paint(self, data, lo, hi, interior, flip, out):
+        # Colours `data` over a fixed [lo, hi] range; in 'Histogram' mode self.hist must already hold the counts
+        lut = colormap_lut(self.cmap)
+        if self.mode == 'Cyclic':
+            _lut_kernel(data, lo, LUT_SIZE / self.cycle, True, self.identity, lut, interior, flip, out)
+        elif self.mode == 'Histogram':
+            cdf = np.cumsum(self.hist)
+            np.floor_divide(cdf * (LUT_SIZE - 1), max(int(cdf[-1]), 1), out=self.equalised, casting='unsafe')
+            _lut_kernel(data, lo, self.histogram_scale(lo, hi, interior), False, self.equalised, lut, interior, flip, out)
+        else:
+            _lut_kernel(data, lo, LUT_SIZE / (hi - lo) if hi > lo else 0.0, False, self.identity, lut, interior, flip, out)
+        return out
+
+def colorize(data, cmap='hot', mode='Linear', max_iter=None):
+    # Fresh (unshared) uint8 RGB image with row 0 at the top
+    return Colorizer(cmap, mode)(data, max_iter, out=np.empty(data.shape + (3,), np.uint8))
+
+def save_image(rgb, filename):
+    # Writes an RGB uint8 buffer without going through a figure: .ppm/.raw straight from memory, anything else via PIL
+    ext = os.path.splitext(filename)[1].lower()
+    if ext in ('.ppm', '.raw', '.rgb'):
+        with open(filename, 'wb') as f:
+            if ext == '.ppm': f.write(b'P6\n%d %d\n255\n' % (rgb.shape[1], rgb.shape[0]))
+            f.write(np.ascontiguousarray(rgb).data)
+    else:
+        from PIL import Image
+        Image.fromarray(rgb).save(filename, compress_level=1) if ext == '.png' else Image.fromarray(rgb).save(filename)
+
+def parse_keyframe(kf):
+    # Keyframes give either 'bounds' [xmin, xmax, ymin, ymax] or 'center' (strings keep deep-zoom digits) and 'span'
+    ftype = kf.get('fractal_type', 0)
+    if isinstance(ftype, str): ftype = FRACTAL_NAMES.index(ftype)
+    if 'center' in kf:
+        center_x, center_y = (Decimal(str(v)) for v in kf['center']); span_x, span_y = (float(v) for v in kf['span'])
+    else:
+        xmin, xmax, ymin, ymax = kf.get('bounds', DEFAULT_BOUNDS[ftype])
+        center_x, center_y = (Decimal(str(xmin)) + Decimal(str(xmax))) / 2, (Decimal(str(ymin)) + Decimal(str(ymax))) / 2
+        span_x, span_y = float(xmax) - float(xmin), float(ymax) - float(ymin)
+    julia_c = kf.get('julia_c', (-0.7, 0.27015))
+    return dict(center_x=center_x, center_y=center_y, span_x=span_x, span_y=span_y, fractal_type=ftype,
+                julia_c=complex(*julia_c) if isinstance(julia_c, (list, tuple)) else complex(julia_c),
+                max_iter=int(kf.get('max_iter', 150)), colormap=kf.get('colormap', 'hot'))
+
+def interpolate_keyframes(keyframes, n_frames):
+    # Spans interpolate geometrically so zooms run at a constant rate; the centre moves in proportion to the
+    # zoom progress, which keeps the target fixed on screen instead of drifting past it. Keyframes without a
+    # 'frame' index are spread evenly over the animation
+    kfs = [parse_keyframe(kf) for kf in keyframes]
+    if len(kfs) == 1: return [dict(kfs[0]) for _ in range(n_frames)]
+    at = [kf.get('frame', round(i * (n_frames - 1) / (len(kfs) - 1))) for i, kf in enumerate(keyframes)]
+    frames = []
+    for f in range(n_frames):
+        i = min(max(np.searchsorted(at, f, side='right') - 1, 0), len(kfs) - 2)
+        a, b = kfs[i], kfs[i + 1]; t = min(max((f - at[i]) / max(at[i + 1] - at[i], 1), 0.0), 1.0)
+        span_x, span_y = a['span_x'] ** (1 - t) * b['span_x'] ** t, a['span_y'] ** (1 - t) * b['span_y'] ** t
+        progress = (a['span_x'] - span_x) / (a['span_x'] - b['span_x']) if a['span_x'] != b['span_x'] else t
+        with decimal.localcontext(decimal.Context(prec=max(30, int(-math.log10(min(span_x, span_y))) + 20))):
+            center_x = a['center_x'] + (b['center_x'] - a['center_x']) * Decimal(progress)
+            center_y = a['center_y'] + (b['center_y'] - a['center_y']) * Decimal(progress)
+        frames.append(dict(center_x=center_x, center_y=center_y, span_x=span_x, span_y=span_y,
+                           fractal_type=a['fractal_type'] if t < 1 else b['fractal_type'],
+                           julia_c=a['julia_c'] + (b['julia_c'] - a['julia_c']) * t,
+                           max_iter=round(a['max_iter'] + (b['max_iter'] - a['max_iter']) * t),
+                           colormap=a['colormap'] if t < 1 else b['colormap']))
+    return frames
+
+def render_frame(frame, width, height):
+    data = render_view(frame['center_x'], frame['center_y'], frame['span_x'], frame['span_y'], width, height,
+                       frame['max_iter'], frame['fractal_type'], frame['julia_c'])
+    return colorize(data, frame['colormap'])
+
+def _render_frame_job(args):
+    # Process-pool entry point: PNG frames are written by the worker, video frames go back to the parent encoder
+    index, frame, width, height, path = args
+    rgb = render_frame(frame, width, height)
+    if path is None: return index, rgb
+    save_image(rgb, path); return index, path
+
+def _init_render_worker(threads):
+    numba.set_num_threads(threads)
+
+class VideoEncoder:
+    # Streams RGB frames to cv2.VideoWriter from a background thread through a bounded queue, so recordings never
+    # hold more than `max_queue` frames in memory. When the encoder falls behind, policy 'drop' discards new frames
+    # (keeps an interactive caller responsive) and 'block' waits for room (for offline renders that need every frame)
+    def __init__(self, filename, size=None, fps=10.0, fourcc='mp4v', max_queue=16, policy='drop', profiler=None):
+        import cv2
+        if policy not in ('drop', 'block'): raise ValueError(f"unknown queue policy {policy!r}")
+        self.cv2, self.filename, self.size, self.fps, self.fourcc, self.policy = cv2, filename, size, float(fps), fourcc, policy
+        self.profiler = profiler
+        self.frames, self.writer, self.error = queue.Queue(max_queue), None, None
+        self.written = self.dropped = 0
+        self.thread = threading.Thread(target=self._run, name='video-encoder', daemon=True); self.thread.start()
+    
+    def write(self, rgb):
+        # Takes ownership of `rgb` (height × width × 3 uint8); returns False if the frame was dropped
+        if self.error is not None or not self.thread.is_alive(): raise RuntimeError(f"video encoder stopped: {self.error}")
+        if self.policy == 'block': self.frames.put(rgb); return True
+        try: self.frames.put_nowait(rgb); return True
+        except queue.Full: self.dropped += 1; return False
+    
+    def write_data(self, data, cmap='hot'):
+        # Colours a fractal array directly; the encoder thread scales it to the fixed output size
+        return self.write(colorize(data, cmap))
+    
+    def _run(self):
+        cv2 = self.cv2
+        try:
+            while (rgb := self.frames.get()) is not None:
+                if self.writer is None:
+                    self.size = self.size or (rgb.shape[1], rgb.shape[0])
+                    self.writer = cv2.VideoWriter(self.filename, cv2.VideoWriter_fourcc(*self.fourcc), self.fps, self.size)
+                    if not self.writer.isOpened(): raise IOError(f"cannot open {self.filename} for writing")
+                with self.profiler.stage('encode', frames=1) if self.profiler else nullcontext():
+                    if (rgb.shape[1], rgb.shape[0]) != self.size:
+                        rgb = cv2.resize(rgb, self.size, interpolation=cv2.INTER_AREA if rgb.shape[1] > self.size[0] else cv2.INTER_LINEAR)
+                    self.writer.write(cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR))
+                self.written += 1
+        except Exception as e:
+            self.error = e
+            while self.frames.get() is not None: pass  # drain so blocked writers and close() return
+        finally:
+            if self.writer is not None: self.writer.release()
+    
+    def close(self, wait=True):
+        if self.thread.is_alive(): self.frames.put(None)
+        if wait:
+            self.thread.join()
+            if self.error is not None: raise self.error
+
+def load_job(path):
+    with open(path) as f: return json.load(f)
+
+def render_animation(job, workers=None, output=None, progress=None):
+    # Renders a keyframe job headlessly. `output` is either a frame pattern like 'frames/zoom_{:05d}.png' or a
+    # video file; frames are spread over a process pool with numba threads split between the workers
+    job = load_job(job) if isinstance(job, str) else job
+    width, height, n_frames = int(job.get('width', 800)), int(job.get('height', 600)), int(job.get('frames', 1))
+    output = output or job.get('output', 'frame_{:05d}.png')
+    frames = interpolate_keyframes(job['keyframes'], n_frames)
+    video = output.lower().endswith(VIDEO_EXTENSIONS)
+    if not video and os.path.dirname(output): os.makedirs(os.path.dirname(output), exist_ok=True)
+    tasks = [(i, f, width, height, None if video else output.format(i)) for i, f in enumerate(frames)]
+    workers = max(1, min(workers or os.cpu_count() or 1, n_frames))
+    if video: encoder = VideoEncoder(output, (width, height), job.get('fps', 30), job.get('fourcc', 'mp4v'), policy='block')
+    results = []
+    try:
+        if workers == 1:
+            jobs = map(_render_frame_job, tasks); pool = None
+        else:
+            import multiprocessing
+            # spawn rather than fork: forking after numba's thread pool has started can deadlock the children
+            pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'), initializer=_init_render_worker,
+                                       initargs=(max(1, numba.config.NUMBA_NUM_THREADS // workers),))
+            jobs = pool.map(_render_frame_job, tasks)
+        for index, result in jobs:  # map yields in frame order, so video frames stream straight into the encoder
+            if video: encoder.write(result)
+            else: results.append(result)
+            if progress: progress(index + 1, n_frames)
+    finally:
+        if pool: pool.shutdown(cancel_futures=True)
+        if video: encoder.close()
+    return [output] if video else results
+
+# ---- Poster export: out-of-core tiled rendering into memory-mapped files, resumable after interruption ----
+
+POSTER_TILE = 1024  # tile edge in pixels; also the height of the colouring strips
+
+def _poster_tile_job(args):
+    # Renders one tile with the compute_fractal kernels (perturbation for deep views) straight into the data memmap
+    data_path, (height, width), (r0, r1, c0, c1), v = args
+    if v['deep']:
+        step_x, step_y = v['span_x'] / (width - 1), v['span_y'] / (height - 1)
+        with decimal.localcontext(decimal.Context(prec=max(30, int(-math.log10(min(step_x, step_y))) + 20))):
+            cx = Decimal(v['center_x']) + Decimal(((c0 + c1 - 1) / 2 - (width - 1) / 2) * step_x)
+            cy = Decimal(v['center_y']) + Decimal(((r0 + r1 - 1) / 2 - (height - 1) / 2) * step_y)
+        tile = compute_fractal_perturbation(cx, cy, max(c1 - c0 - 1, 1) * step_x, max(r1 - r0 - 1, 1) * step_y, c1 - c0, r1 - r0,
+                                            v['max_iter'], v['fractal_type'], v['julia_c'])
+    else:
+        # Slices of the full-image linspace, so tiles land on exactly the pixel grid compute_fractal would use
+        x, y = np.linspace(v['xmin'], v['xmax'], width)[c0:c1], np.linspace(v['ymin'], v['ymax'], height)[r0:r1]
+        tile = compute_fractal_grid(x, y, v['max_iter'], v['fractal_type'], v['julia_c'])
+    data = np.memmap(data_path, np.float32, 'r+', shape=(height, width))
+    data[r0:r1, c0:c1] = tile; data.flush(); del data
+    return r0, c0
+
+def render_poster(filename, center_x, center_y, span_x, span_y, width, height, max_iter=1000, fractal_type=0,
+                  julia_c=complex(-0.7, 0.27015), cmap='hot', color_mode='Linear', tile=POSTER_TILE, workers=None,
+                  progress=None, keep_data=False):
+    # Exports images far larger than memory (.ppm, or headerless .raw/.rgb). Tiles render across a process pool
+    # into a float32 memmap '<filename>.iter'; then the output file, memory-mapped behind its header, is coloured
+    # strip by strip with global min/max and histogram so tiles don't show seams. '<filename>.state.json' records
+    # finished tiles, and calling again with the same arguments after an interruption renders only the missing ones
+    if os.path.splitext(filename)[1].lower() not in ('.ppm', '.raw', '.rgb'):
+        raise ValueError("poster output must be .ppm, .raw or .rgb (formats that can be written in place)")
+    state_path, data_path = filename + '.state.json', filename + '.iter'
+    params = dict(center=[str(center_x), str(center_y)], span=[float(span_x), float(span_y)], size=[width, height],
+                  max_iter=int(max_iter), fractal_type=fractal_type, julia_c=[julia_c.real, julia_c.imag], tile=tile)
+    state = dict(params=params, done=[])
+    if os.path.exists(state_path) and os.path.exists(data_path):
+        with open(state_path) as f: saved = json.load(f)
+        if saved['params'] == params: state = saved
+    done = {tuple(t) for t in state['done']}
+    if not done: np.memmap(data_path, np.float32, 'w+', shape=(height, width)).flush()
+    
+    cx, cy = float(center_x), float(center_y)
+    view = dict(center_x=str(center_x), center_y=str(center_y), span_x=span_x, span_y=span_y, max_iter=int(max_iter),
+                fractal_type=fractal_type, julia_c=julia_c, deep=is_deep_view(center_x, center_y, span_x, span_y, width, height),
+                xmin=cx - span_x / 2, xmax=cx + span_x / 2, ymin=cy - span_y / 2, ymax=cy + span_y / 2)
+    tasks = [(data_path, (height, width), (r0, min(r0 + tile, height), c0, min(c0 + tile, width)), view)
+             for r0 in range(0, height, tile) for c0 in range(0, width, tile) if (r0, c0) not in done]
+    n_tiles = len(tasks) + len(done)
+    
+    def finished(r0, c0):
+        done.add((r0, c0)); state['done'] = sorted(done)
+        with open(state_path + '.tmp', 'w') as f: json.dump(state, f)
+        os.replace(state_path + '.tmp', state_path)
+        if progress: progress(len(done), n_tiles)
+    
+    workers = max(1, min(workers or os.cpu_count() or 1, len(tasks) or 1))
+    if workers == 1:
+        for task in tasks: finished(*_poster_tile_job(task))
+    elif tasks:
+        import multiprocessing
+        from concurrent.futures import as_completed
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'), initializer=_init_render_worker,
+                                 initargs=(max(1, numba.config.NUMBA_NUM_THREADS // workers),)) as pool:
+            for future in as_completed([pool.submit(_poster_tile_job, task) for task in tasks]): finished(*future.result())
+    
+    # Each strip gets its own short-lived mapping, so resident pages stay at one strip however large the files are
+    strips = [(r0, min(r0 + tile, height)) for r0 in range(0, height, tile)]
+    rows = lambda a, b: np.memmap(data_path, np.float32, 'r', offset=a * width * 4, shape=(b - a, width))
+    lo, hi = min(float(rows(a, b).min()) for a, b in strips), max(float(rows(a, b).max()) for a, b in strips)
+    colorizer = Colorizer(cmap, color_mode); interior = colorizer.interior_level(max_iter)
+    if color_mode == 'Histogram':
+        for a, b in strips: colorizer.accumulate(np.asarray(rows(a, b)), lo, hi, interior)
+    header = b'P6\n%d %d\n255\n' % (width, height) if filename.lower().endswith('.ppm') else b''
+    with open(filename, 'wb') as f: f.write(header); f.truncate(len(header) + width * height * 3)
+    for a, b in strips:  # data rows run bottom-up, image rows top-down, so strip [a, b) fills image rows [H-b, H-a)
+        image = np.memmap(filename, np.uint8, 'r+', offset=len(header) + (height - b) * width * 3, shape=(b - a, width, 3))
+        colorizer.paint(np.asarray(rows(a, b)), lo, hi, interior, True, np.asarray(image)); image.flush(); del image
+    if not keep_data: os.remove(data_path); os.remove(state_path)
+    return filename
+
+# ---- Render store: finished renders on disk, keyed by a hash of the canonical view, so revisits load instead of rendering ----
+
+STORE_PATH = os.environ.get('MANDELBROT_STORE', os.path.join(os.path.expanduser('~'), '.cache', 'mandelbrot_explorer'))
+
+def render_key(center_x, center_y, span_x, span_y, width, height, max_iter, fractal_type=0, julia_c=complex(-0.7, 0.27015)):
+    # Centres are rounded to a thousandth of a pixel and spans to 12 digits, so the same view reached by different
+    # zoom paths (and float noise from pan arithmetic) shares one entry; julia_c only counts for Julia sets
+    step = min(span_x / max(width - 1, 1), span_y / max(height - 1, 1))
+    quantum = Decimal(1).scaleb(Decimal(step).adjusted() - 3)
+    with decimal.localcontext(decimal.Context(prec=max(30, -quantum.adjusted() + 10))):
+        cx, cy = (str(Decimal(str(v)).quantize(quantum) + 0) for v in (center_x, center_y))
+    params = dict(center=[cx, cy], span=[float('%.12g' % span_x), float('%.12g' % span_y)], size=[int(width), int(height)],
+                  max_iter=int(max_iter), fractal_type=int(fractal_type),
+                  julia_c=[julia_c.real, julia_c.imag] if fractal_type == 1 else None)
+    return hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest(), params
+
+class RenderStore:
+    # Entries are compressed float32 .npz files named by key. Ordinary entries live in renders/ under an LRU byte
+    # budget: the directory is scanned once (oldest mtime first) and then tracked in memory, so puts do not stat the
+    # whole store; entries another process adds are picked up on the next open. Pinned entries (favorites) live
+    # in pinned/, which eviction never touches
+    def __init__(self, path=STORE_PATH, max_bytes=2**30):
+        self.path, self.max_bytes, self.hits, self.misses = path, max_bytes, 0, 0
+        self.renders, self.pinned = os.path.join(path, 'renders'), os.path.join(path, 'pinned')
+        self.index, self.lock = None, threading.Lock()
+
+    def entry(self, key, pinned=False): return os.path.join(self.pinned if pinned else self.renders, key + '.npz')
+
+    def __contains__(self, key): return os.path.exists(self.entry(key, True)) or os.path.exists(self.entry(key))
+
+    def lru(self):
+        # Path -> size, least recently used first; built on first use. Call with the lock held
+        if self.index is None:
+            files = sorted((e.stat().st_mtime, e.path, e.stat().st_size) for e in self.entries(self.renders))
+            self.index = OrderedDict((path, size) for _, path, size in files)
+        return self.index
+
+    def get(self, key):
+        for pinned in (True, False):
+            path = self.entry(key, pinned)
+            try:
+                with np.load(path) as f: data = f['data'].astype(np.float64)
+            except FileNotFoundError: continue
+            except Exception:  # truncated or corrupt entry: drop it and render again
+                self.discard(key, pinned); continue
+            if not pinned:
+                os.utime(path)
+                with self.lock:
+                    if path in self.lru(): self.index.move_to_end(path)
+            self.hits += 1
+            return data
+        self.misses += 1
+        return None
+
+    def put(self, key, params, data, pinned=False):
+        # Written under a temporary name and renamed, so readers never see half an entry
+        folder = self.pinned if pinned else self.renders; os.makedirs(folder, exist_ok=True)
+        tmp = os.path.join(folder, f'{key}.{os.getpid()}.{threading.get_ident()}.tmp.npz')
+        np.savez_compressed(tmp, data=np.asarray(data, np.float32), params=json.dumps(params))
+        path = self.entry(key, pinned); os.replace(tmp, path)
+        if pinned: self.discard(key); return
+        with self.lock:
+            index = self.lru(); index.pop(path, None); index[path] = os.path.getsize(path)
+            total = sum(index.values())
+            while total > self.max_bytes and len(index) > 1:
+                old, size = index.popitem(last=False); total -= size
+                try: os.remove(old)
+                except OSError: pass
+
+    def discard(self, key, pinned=False):
+        path = self.entry(key, pinned)
+        try: os.remove(path)
+        except OSError: pass
+        if not pinned:
+            with self.lock:
+                if self.index is not None: self.index.pop(path, None)
+
+    def entries(self, folder):
+        try: return [e for e in os.scandir(folder) if e.name.endswith('.npz') and '.tmp.' not in e.name]
+        except FileNotFoundError: return []
+
+    def clear(self, pinned=False):
+        # Drops the evictable entries; pinned=True also drops favorites
+        for folder in (self.renders, self.pinned) if pinned else (self.renders,):
+            for e in self.entries(folder): os.remove(e.path)
+        with self.lock: self.index = None
+
+    def stats(self):
+        with self.lock: index = dict(self.lru())
+        pinned = self.entries(self.pinned)
+        return dict(hits=self.hits, misses=self.misses, renders=len(index), nbytes=sum(index.values()),
+                    pinned=len(pinned), pinned_nbytes=sum(e.stat().st_size for e in pinned))
+
+    def load_favorites(self):
+        try:
+            with open(os.path.join(self.path, 'favorites.json')) as f: return json.load(f)
+        except (FileNotFoundError, ValueError): return []
+
+    def save_favorites(self, favorites):
+        os.makedirs(self.path, exist_ok=True)
+        tmp = os.path.join(self.path, f'favorites.json.{os.getpid()}.tmp')
+        with open(tmp, 'w') as f: json.dump(favorites, f, indent=1)
+        os.replace(tmp, os.path.join(self.path, 'favorites.json'))
+
+def prewarm_store(views, width=800, height=600, store=None, progress=None, pinned=False):
+    # Renders keyframe-style views (favorites, job frames) into the store ahead of time; views already stored are skipped.
+    # A view's own 'width'/'height' override the defaults, so favorites come back at the size they were saved at;
+    # pinned=True keeps the entries out of eviction, as the explorer does for favorites
+    store = store or RenderStore(); rendered = 0
+    for i, view in enumerate(views):
+        v = parse_keyframe(view) if 'center_x' not in view else view
+        w, h = int(view.get('width', width)), int(view.get('height', height))
+        key, params = render_key(v['center_x'], v['center_y'], v['span_x'], v['span_y'], w, h, v['max_iter'], v['fractal_type'], v['julia_c'])
+        if not os.path.exists(store.entry(key, True)) and (pinned or key not in store):
+            store.put(key, params, render_view(v['center_x'], v['center_y'], v['span_x'], v['span_y'], w, h, v['max_iter'],
+                                               v['fractal_type'], v['julia_c']), pinned); rendered += 1
+        if progress: progress(i + 1, len(views))
+    return rendered
+
+# ---- Instrumentation: per-stage wall times and work counters ----
+
+class Profiler:
+    # Stages keep a rolling window of recent durations plus running totals; counters passed with a record add up
+    # per stage, so rates such as pixels/s are counter totals over that stage's total time. With `log` set, each
+    # record is also appended to that file as a JSON line. Safe to share between the GUI and worker threads
+    def __init__(self, window=100, log=None):
+        self.window, self.log, self.lock = window, log, threading.Lock(); self.reset()
+    
+    def reset(self):
+        with self.lock: self.times, self.totals, self.counters, self.latest = {}, {}, {}, {}
+    
+    @contextmanager
+    def stage(self, name, **counts):
+        # Yields the counts dict so the block can fill in work it only knows at the end; blocks that raise are not recorded
+        start = time.perf_counter(); yield counts
+        self.record(name, time.perf_counter() - start, **counts)
+    
+    def record(self, name, seconds, **counts):
+        with self.lock:
+            self.times.setdefault(name, deque(maxlen=self.window)).append(seconds)
+            calls, total = self.totals.get(name, (0, 0.0)); self.totals[name] = (calls + 1, total + seconds)
+            totals = self.counters.setdefault(name, {})
+            for k, v in counts.items(): totals[k] = totals.get(k, 0) + v
+            self.latest[name] = counts
+            if self.log:
+                with open(self.log, 'a') as f: f.write(json.dumps(dict(time=time.time(), stage=name, seconds=seconds, **counts)) + '\n')
+    
+    def stats(self):
+        with self.lock:
+            out = {}
+            for name, (calls, total) in self.totals.items():
+                recent, counters = self.times[name], self.counters[name]
+                out[name] = dict(calls=calls, total=total, last=recent[-1], mean=sum(recent) / len(recent), max=max(recent),
+                                 counters=dict(counters), rates={k: v / total for k, v in counters.items() if total > 0},
+                                 latest=dict(self.latest[name]))
+            return out
+    
+    def mean(self, name): return self.stats().get(name, {}).get('mean', 0.0)
+    
+    def export(self, path):
+        with open(path, 'w') as f: json.dump(self.stats(), f, indent=1)
+        return path
+    
+    def summary(self):
+        lines = []
+        for name, s in self.stats().items():
+            rates = '  '.join(f"{v:.3g} {k}/s" for k, v in s['rates'].items())
+            lines.append(f"{name:<10}{s['calls']:>6} calls  mean {s['mean']*1000:8.1f} ms  max {s['max']*1000:8.1f} ms  {rates}")
+        return '\n'.join(lines)
+
+def work_counts(data, max_iter):
+    # Pixels, iterations and escapes represented by a count array. Interior pixels count as max_iter iterations,
+    # so with interior/periodicity checks or subdivision this is equivalent work rather than iterations executed
+    return dict(pixels=int(data.size), iterations=float(np.minimum(data, max_iter).sum()), escaped=int((data < max_iter).sum()))
+
+RENDER_ENGINES = ['Pixel', 'Subdivide', 'Tiled']
+RENDER_PASSES = (8, 2, 1)  # progressive refinement: 1/8 resolution preview, then 1/2, then full
 
 class AdvancedFractalExplorer:
-    def __init__(self, width=800, height=600):
+    def __init__(self, width=800, height=600, profile=None):
         vars(self).update(width=width, height=height, max_iter=150, fractal_type=0, julia_c=complex(-0.7,0.27015),
-                         julia_morphing=False, morph_speed=0.01, gpu_enabled=GPU_AVAILABLE, show_3d=False,
-                         auto_explore=False, recording_video=False, video_frames=[], interesting_regions=[],
-                         region_markers=[], zoom_factor=0.7, color_cycle=0, render_mode=0, computation_times=[],
-                         zoom_history=[], favorite_locations=[], xmin=-2.5, xmax=1.5, ymin=-1.5, ymax=1.5)
+                         julia_morphing=False, morph_speed=0.01, gpu_enabled=gpu_available(), show_3d=False,
+                         auto_explore=False, recording_video=False, video_encoder=None, video_source='fractal', interesting_regions=[],
+                         region_markers=[], regions_source=None, region_reuse=True, sonifier=None, zoom_factor=0.7,
+                         surface=None, surface_source=None, mesh_budget=4800, render_mode=0, computation_times=[],
+                         color_cycle=0, color_mode=0, colorizer=Colorizer(),
+                         zoom_history=[], render_store=RenderStore(), render_engine=0, skipped_fraction=0.0,
+                         series_approximation=True, tile_cache=TileCache(), incremental=None, pixel_render=None,
+                         render_generation=0, julia_generation=0, render_lock=threading.Lock(), render_results=queue.Queue(),
+                         profiler=Profiler(log=profile))
+        self.favorite_locations = self.render_store.load_favorites()
+        self.favorite_keys = {self.favorite_key(fav) for fav in self.favorite_locations}
+        load_gui(); self.set_bounds(-2.5, 1.5, -1.5, 1.5)
+        self.executor = ThreadPoolExecutor(max_workers=4)
         
         self.fig = plt.figure(figsize=(20, 12))
+        # Every real draw, including the coalesced ones draw_idle schedules, is timed as the 'draw' stage
+        canvas_draw = self.fig.canvas.draw
+        def timed_draw(*args, **kwargs):
+            with self.profiler.stage('draw'): return canvas_draw(*args, **kwargs)
+        self.fig.canvas.draw = timed_draw
         gs = self.fig.add_gridspec(2, (4 if self.show_3d else 3), height_ratios=[3 if self.show_3d else 4, 1], 
                                   width_ratios=[2,2,1,1] if self.show_3d else [3,3,1])
         self.ax_main = self.fig.add_subplot(gs[0, 0 if self.show_3d else slice(2)])
@@ -92,10 +1173,11 @@ class AdvancedFractalExplorer:
         self.ax_stats = self.fig.add_subplot(gs[0, 3]) if self.show_3d else None
         self.ax_controls = self.fig.add_subplot(gs[1, :])
         self.fig.suptitle('🚀 Ultra-Advanced Fractal Explorer AI 🚀', fontsize=20, fontweight='bold')
-        self.fractal_data = compute_fractal(self.xmin, self.xmax, self.ymin, self.ymax, 
-                                          self.width, self.height, self.max_iter, self.fractal_type, self.julia_c)
-        self.im_main = self.ax_main.imshow(self.fractal_data, extent=[self.xmin, self.xmax, self.ymin, self.ymax],
-                                          cmap='hot', origin='lower', interpolation='bilinear')
+        self.fractal_view = self.view_snapshot(); self.fractal_data = self.compute_view(self.width, self.height, self.max_iter, self.fractal_view)
+        self.display_data, self.display_max_iter = self.fractal_data, self.max_iter
+        # The main image is shown as pre-coloured uint8 RGB from the LUT colorizer, so matplotlib only blits it
+        self.im_main = self.ax_main.imshow(self.colorizer(self.fractal_data, self.max_iter, flip=False), extent=self.view_extent(),
+                                          origin='lower', interpolation='nearest')
         julia_data = compute_fractal(-2, 2, -2, 2, 200, 200, 80, 1, self.julia_c)
         self.im_julia = self.ax_julia_preview.imshow(julia_data, extent=[-2, 2, -2, 2], cmap='plasma', origin='lower')
         self.ax_julia_preview.set_title('Julia Preview'); self.ax_julia_preview.set_xticks([]); self.ax_julia_preview.set_yticks([])
@@ -105,7 +1187,8 @@ class AdvancedFractalExplorer:
         self.zoom_rect, self.zoom_start = None, None
         self.ax_main.set_xlabel('Real Axis'); self.ax_main.set_ylabel('Imaginary Axis')
         self.update_interesting_regions(); self.setup_controls(); self.setup_events()
-        self.executor = ThreadPoolExecutor(max_workers=4); self.computation_future = None
+        self.render_timer = self.fig.canvas.new_timer(interval=15)
+        self.render_timer.add_callback(self.poll_render_results); self.render_timer.start()
         self.animation = animation.FuncAnimation(self.fig, self.animate, interval=50, blit=False)
     
     def setup_controls(self):
@@ -161,6 +1244,13 @@ class AdvancedFractalExplorer:
         fractal_names = ['Mandelbrot', 'Julia', 'Burning Ship', 'Tricorn']
         render_modes = ['Normal', 'Edge Detection', 'Hybrid']
         avg_time = np.mean(self.computation_times[-5:]) if self.computation_times else 0
+        # Edge and Hybrid modes need dz/dc, so outside deep zooms they always run the fused distance kernel
+        if self.deep_zoom: engine = 'Perturbation (deep zoom)'
+        elif self.render_mode != 0: engine = 'Fused distance (edge modes)'
+        else: engine = RENDER_ENGINES[self.render_engine] + (f' ({self.skipped_fraction:.0%} skipped)' if self.render_engine == 1 else '')
+        stats = self.profiler.stats(); iterate = stats.get('iterate', {})
+        rates, latest = iterate.get('rates', {}), iterate.get('latest', {})
+        digits = max(6, int(-math.log10(self.span_x)) + 3)
         return f"""🎮 Controls:
 • Click/Drag: Zoom to area
 • Shift+Click: Center view
@@ -168,83 +1258,285 @@ class AdvancedFractalExplorer:
 • Space: Toggle morphing
 • R: Reset view
 • S: Save image
+• E: Cycle engine
+• B: Back to previous view
+• M / N: Colormap / colour mode
+• 1-9: Open favorite
+• T: Export timings
 
 📊 Current State:
 Fractal: {fractal_names[self.fractal_type]}
 Render: {render_modes[self.render_mode]}
+Colors: {COLORMAPS[self.color_cycle]} ({COLOR_MODES[self.color_mode]})
+Engine: {engine}
+Tiles: {self.tile_cache.hits} hit / {self.tile_cache.misses} miss ({self.tile_cache.nbytes / 2**20:.0f} MB)
+Store: {self.render_store.hits} hit / {self.render_store.misses} miss
 Julia C: {self.julia_c:.4f}
 Morphing: {'ON' if self.julia_morphing else 'OFF'}
 
 📍 View Info:
-Real: [{self.xmin:.6f}, {self.xmax:.6f}]
-Imag: [{self.ymin:.6f}, {self.ymax:.6f}]
-Zoom: {1/((self.xmax-self.xmin)/4):.1f}x
+Re: {self.center_x:.{digits}f}
+Im: {self.center_y:.{digits}f}
+Zoom: {4 / self.span_x:.4g}x
 Iterations: {self.max_iter}
 
 ⚡ Performance:
 Avg Time: {avg_time:.2f}s
+Iterate: {iterate.get('mean', 0)*1000:.0f} ms ({rates.get('pixels', 0) / 1e6:.1f} Mpix/s, {rates.get('iterations', 0) / 1e9:.2f} Giter/s)
+Escaped: {latest.get('escaped', 0) / max(latest.get('pixels', 1), 1):.0%}
+Color / Draw: {stats.get('color', {}).get('mean', 0)*1000:.0f} / {stats.get('draw', {}).get('mean', 0)*1000:.0f} ms
 Favorites: {len(self.favorite_locations)}"""
     
+    # The view is a Decimal centre plus float spans so zooming is not limited by float64 coordinates;
+    # xmin/xmax/ymin/ymax are float approximations kept for display and the float engines
+    xmin = property(lambda self: float(self.center_x) - self.span_x / 2)
+    xmax = property(lambda self: float(self.center_x) + self.span_x / 2)
+    ymin = property(lambda self: float(self.center_y) - self.span_y / 2)
+    ymax = property(lambda self: float(self.center_y) + self.span_y / 2)
+    
+    deep_zoom = property(lambda self: is_deep_view(self.center_x, self.center_y, self.span_x, self.span_y, self.width, self.height))
+    
+    def view_context(self):
+        ctx = decimal.Context(prec=max(30, int(-math.log10(min(self.span_x, self.span_y))) + 20))
+        return decimal.localcontext(ctx)
+    
+    def set_view(self, center_x, center_y, span_x, span_y):
+        self.center_x, self.center_y = Decimal(center_x), Decimal(center_y)
+        self.span_x, self.span_y = float(span_x), float(span_y)
+    
+    def set_bounds(self, xmin, xmax, ymin, ymax):
+        self.set_view((Decimal(xmin) + Decimal(xmax)) / 2, (Decimal(ymin) + Decimal(ymax)) / 2, xmax - xmin, ymax - ymin)
+    
+    def view_extent(self):
+        # Deep views are displayed in offsets from the centre, which stay distinct in float64
+        if self.deep_zoom: return [-self.span_x / 2, self.span_x / 2, -self.span_y / 2, self.span_y / 2]
+        return [self.xmin, self.xmax, self.ymin, self.ymax]
+    
+    def display_to_complex(self, x, y):
+        with self.view_context():
+            if self.deep_zoom: return self.center_x + Decimal(float(x)), self.center_y + Decimal(float(y))
+            return +Decimal(float(x)), +Decimal(float(y))
+    
+    def pixel_to_complex(self, px, py):
+        with self.view_context():
+            return (self.center_x + Decimal((px / (self.width - 1) - 0.5) * self.span_x),
+                    self.center_y + Decimal((py / (self.height - 1) - 0.5) * self.span_y))
+    
+    def pan(self, fx, fy):
+        with self.view_context():
+            self.center_x += Decimal(fx * self.span_x); self.center_y += Decimal(fy * self.span_y)
+    
+    def push_history(self):
+        # Views left behind are the ones worth keeping on disk, so history pushes are what feed the render store
+        self.zoom_history.append((self.center_x, self.center_y, self.span_x, self.span_y))
+        if self.store_key(self.fractal_view)[0] == self.store_key(self.view_snapshot())[0]:
+            self.store_render(self.fractal_view, self.fractal_data)
+    
+    def store_render(self, view, data, pinned=False):
+        # Compressing an entry takes ~0.1 s, so the write runs on the executor rather than the GUI thread
+        key, params = self.store_key(view)
+        stored = os.path.exists(self.render_store.entry(key, True)) or (not pinned and key in self.render_store)
+        if self.exact(view) and not stored: self.executor.submit(self.render_store.put, key, params, data, pinned)
+    
     def zoom(self, factor, center_x=None, center_y=None):
-        if center_x is None:
-            center_x = (self.xmin + self.xmax) / 2
-        if center_y is None:
-            center_y = (self.ymin + self.ymax) / 2
-        
-        self.zoom_history.append((self.xmin, self.xmax, self.ymin, self.ymax))
+        self.push_history()
         if len(self.zoom_history) > 50:
             self.zoom_history.pop(0)
         
-        width = (self.xmax - self.xmin) * factor
-        height = (self.ymax - self.ymin) * factor
-        self.xmin = center_x - width / 2
-        self.xmax = center_x + width / 2
-        self.ymin = center_y - height / 2
-        self.ymax = center_y + height / 2
+        self.set_view(self.center_x if center_x is None else center_x, self.center_y if center_y is None else center_y,
+                      self.span_x * factor, self.span_y * factor)
         self.update_fractal()
     
+    def go_back(self):
+        if self.zoom_history:
+            self.set_view(*self.zoom_history.pop())
+            self.update_fractal()
+    
     def reset_view(self):
-        bounds = [(-2.5, 1.5, -1.5, 1.5), (-2, 2, -2, 2), (-2.5, 1.5, -2.5, 1.5), (-2.5, 1.5, -1.5, 1.5)]
-        self.xmin, self.xmax, self.ymin, self.ymax = bounds[self.fractal_type]
+        self.set_bounds(*DEFAULT_BOUNDS[self.fractal_type])
         self.zoom_history.clear()
         self.update_fractal()
     
     def cycle_colors(self):
-        colormaps = ['hot', 'plasma', 'viridis', 'magma', 'inferno', 'cividis', 
-                    'rainbow', 'twilight', 'turbo', 'gist_ncar', 'nipy_spectral']
-        self.color_cycle = (self.color_cycle + 1) % len(colormaps)
-        self.im_main.set_cmap(colormaps[self.color_cycle])
-        self.fig.canvas.draw()
+        self.color_cycle = (self.color_cycle + 1) % len(COLORMAPS)
+        self.colorizer.cmap = COLORMAPS[self.color_cycle]; self.recolor()
+    
+    def cycle_color_mode(self):
+        self.color_mode = (self.color_mode + 1) % len(COLOR_MODES)
+        self.colorizer.mode = COLOR_MODES[self.color_mode]; self.recolor()
+    
+    def recolor(self):
+        # Colour changes only re-run the LUT pass over the last displayed data
+        self.im_main.set_array(self.colorizer(self.display_data, self.display_max_iter, flip=False))
+        self.info_text.set_text(self.get_info_text()); self.fig.canvas.draw_idle()
     
     def update_iterations(self, val): self.max_iter = int(val); self.update_fractal()
-    def change_fractal_type(self, label): self.fractal_type = {'Mandelbrot':0,'Julia':1,'Burning Ship':2,'Tricorn':3}[label]; self.reset_view()
+    def change_fractal_type(self, label): self.fractal_type = FRACTAL_NAMES.index(label); self.reset_view()
     def update_julia_parameter(self, val): self.julia_c = complex(self.slider_julia_real.val, self.slider_julia_imag.val); self.update_fractal() if self.fractal_type == 1 else None; self.update_julia_preview()
     def cycle_render_mode(self): self.render_mode = (self.render_mode + 1) % 3; self.update_fractal()
+    def cycle_render_engine(self): self.render_engine = (self.render_engine + 1) % len(RENDER_ENGINES); self.update_fractal()
     def toggle_morphing(self): self.julia_morphing = not self.julia_morphing
     
     def save_favorite(self):
+        # Favorites persist as JSON next to the render store, and the current render goes into the store with them
         favorite = {'fractal_type': self.fractal_type, 'bounds': (self.xmin, self.xmax, self.ymin, self.ymax),
-                   'julia_c': self.julia_c, 'max_iter': self.max_iter, 'timestamp': datetime.now().isoformat()}
-        self.favorite_locations.append(favorite)
+                   'center': (str(self.center_x), str(self.center_y)), 'span': (self.span_x, self.span_y),
+                   'julia_c': (self.julia_c.real, self.julia_c.imag), 'max_iter': self.max_iter,
+                   'width': self.width, 'height': self.height, 'timestamp': datetime.now().isoformat()}
+        self.favorite_locations.append(favorite); self.favorite_keys.add(self.favorite_key(favorite))
+        # Favorites are pinned in the store. fractal_data may still be the previous view while a render is in
+        # flight; then show_render pins the view when its final pass lands
+        if self.store_key(self.fractal_view)[0] == self.favorite_key(favorite):
+            self.store_render(self.fractal_view, self.fractal_data, True)
+        self.render_store.save_favorites(self.favorite_locations)
         print(f"⭐ Saved favorite location #{len(self.favorite_locations)}")
     
-    def update_fractal(self):
-        start_time = time.time()
-        self.fractal_data = compute_fractal(self.xmin, self.xmax, self.ymin, self.ymax,
-                                          self.width, self.height, self.max_iter, 
-                                          self.fractal_type, self.julia_c)
-        
-        if self.render_mode == 1:
-            edges = create_distance_estimation(self.fractal_data, self.xmin, self.xmax, self.ymin, self.ymax)
-            display_data = edges
-        elif self.render_mode == 2:
-            edges = create_distance_estimation(self.fractal_data, self.xmin, self.xmax, self.ymin, self.ymax)
-            display_data = self.fractal_data + edges * 20
-        else:
-            display_data = self.fractal_data
-        
-        self.im_main.set_array(display_data)
-        self.im_main.set_extent([self.xmin, self.xmax, self.ymin, self.ymax])
+    def open_favorite(self, index):
+        if index >= len(self.favorite_locations): return
+        fav = parse_keyframe(self.favorite_locations[index])
+        self.push_history()
+        self.fractal_type, self.julia_c, self.max_iter = fav['fractal_type'], fav['julia_c'], fav['max_iter']
+        # Widgets follow the favorite with their callbacks muted, which would otherwise reset or re-render the view
+        for widget, value in ((self.radio_fractal, self.fractal_type), (self.slider_iter, self.max_iter),
+                              (self.slider_julia_real, self.julia_c.real), (self.slider_julia_imag, self.julia_c.imag)):
+            widget.eventson = False
+            widget.set_active(value) if widget is self.radio_fractal else widget.set_val(value)
+            widget.eventson = True
+        self.set_view(fav['center_x'], fav['center_y'], fav['span_x'], fav['span_y']); self.update_fractal(); self.update_julia_preview()
+    
+    def favorite_key(self, favorite):
+        fav = parse_keyframe(favorite)
+        return render_key(fav['center_x'], fav['center_y'], fav['span_x'], fav['span_y'], self.width, self.height, fav['max_iter'],
+                          fav['fractal_type'], fav['julia_c'])[0]
+    
+    def exact(self, view):
+        # Store hits ignore the engine, so only renders matching the per-pixel engine may feed the store: Tiled
+        # resamples cached tiles and Subdivide fills rectangles from their borders. Edge modes run the fused kernel
+        return view.deep or view.render_mode != 0 or view.render_engine == 0
+    
+    def store_key(self, view):
+        return render_key(view.center_x, view.center_y, view.span_x, view.span_y, self.width, self.height, view.max_iter,
+                          view.fractal_type, view.julia_c)
+    
+    def view_snapshot(self):
+        # Everything a render needs, captured on the GUI thread so background passes never see a half-updated view
+        return SimpleNamespace(center_x=self.center_x, center_y=self.center_y, span_x=self.span_x, span_y=self.span_y,
+                               xmin=self.xmin, xmax=self.xmax, ymin=self.ymin, ymax=self.ymax, extent=self.view_extent(),
+                               deep=self.deep_zoom, fractal_type=self.fractal_type, julia_c=self.julia_c, max_iter=self.max_iter,
+                               render_engine=self.render_engine, render_mode=self.render_mode)
+    
+    def compute_view(self, width, height, max_iter, view=None, cancelled=None, with_distance=False):
+        # Returns None if `cancelled` reports the render obsolete before it finishes. with_distance=True returns
+        # (data, dist) from the fused derivative kernel; deep views have no derivative and give dist=None
+        v = view or self.view_snapshot()
+        if with_distance:
+            if not v.deep:
+                result = compute_fractal_distance(v.xmin, v.xmax, v.ymin, v.ymax, width, height, max_iter, v.fractal_type,
+                                                  v.julia_c, cancelled=cancelled)
+                return None if result is None else result[:2]
+            data = self.compute_view(width, height, max_iter, v, cancelled)
+            return None if data is None else (data, None)
+        if v.deep:
+            return compute_fractal_perturbation(v.center_x, v.center_y, v.span_x, v.span_y, width, height, max_iter,
+                                                v.fractal_type, v.julia_c, self.series_approximation, cancelled=cancelled)
+        xmin, xmax, ymin, ymax = v.xmin, v.xmax, v.ymin, v.ymax
+        if v.render_engine == 2:
+            return render_tiled(self.tile_cache, xmin, xmax, ymin, ymax, width, height, max_iter, v.fractal_type, v.julia_c, cancelled)
+        if v.render_engine == 0 and (width, height) == (self.width, self.height):
+            # New views go through the parallel kernel. Resumable orbit state is only built once max_iter changes
+            # on the same view, after which further iteration changes cost only the extra iterations
+            key = self.incremental_key(v)
+            if self.incremental is None or self.incremental.key != key:
+                if self.pixel_render is None or self.pixel_render[0] != key or self.pixel_render[1] == max_iter:
+                    self.incremental = None
+                    data = compute_fractal(xmin, xmax, ymin, ymax, width, height, max_iter, v.fractal_type, v.julia_c)
+                    self.pixel_render = (key, max_iter); return data
+                self.incremental = IncrementalRender(xmin, xmax, ymin, ymax, width, height, v.fractal_type, v.julia_c)
+            return self.incremental.render(max_iter, cancelled)
+        if v.render_engine == 1:
+            result = compute_fractal_subdivided(xmin, xmax, ymin, ymax, width, height, max_iter, v.fractal_type, v.julia_c, cancelled=cancelled)
+            if result is None: return None
+            data, skipped = result; self.skipped_fraction = skipped / data.size
+            return data
+        return compute_fractal(xmin, xmax, ymin, ymax, width, height, max_iter, v.fractal_type, v.julia_c)
+    
+    def incremental_key(self, view):
+        return (view.xmin, view.xmax, view.ymin, view.ymax, self.width, self.height, view.fractal_type,
+                view.julia_c if view.fractal_type == 1 else None)
+    
+    def resumable(self, view):
+        # True when the full-size pass only has to resume stored orbits (an iteration change on the same view)
+        return (not view.deep and view.render_engine == 0 and view.render_mode == 0 and self.incremental is not None
+                and self.incremental.key == self.incremental_key(view))
+    
+    def post_process(self, data, view, dist=None):
+        # Edge and Hybrid modes shade by distance to the set; `dist` may be overwritten
+        if view.render_mode == 0: return data
+        if dist is None:
+            # |grad smooth count| ≈ 1 / (2·ln2·distance), which recovers the estimate from the counts alone
+            dist = create_distance_estimation(data, 0, view.span_x, 0, view.span_y)
+            np.divide(0.5 / math.log(2), dist, out=dist, where=dist > 0)
+        edges = distance_edges(dist, view.span_x / max(data.shape[1] - 1, 1))
+        if view.render_mode == 2: edges *= 20; edges += data
+        return edges
+    
+    def update_fractal(self, wait=False):
+        # Renders run on the executor as coarse-to-fine passes; a newer request bumps render_generation, which
+        # makes older jobs stop at their next check and their queued results get dropped
+        self.render_generation += 1
+        future = self.executor.submit(self.render_job, self.render_generation, self.view_snapshot(), time.time())
+        if wait: future.result(); self.poll_render_results()
+    
+    def render_job(self, generation, view, start_time):
+        # Views already in the render store (history, favorites, prewarmed jobs) skip the passes entirely; stored
+        # entries carry only the counts, so edge modes fall back to the gradient distance estimate for them
+        cancelled = lambda: generation != self.render_generation
+        try:
+            key, params = self.store_key(view)
+            with self.profiler.stage('store'): data = self.render_store.get(key)
+            if data is not None:
+                with self.profiler.stage('post'): display = self.post_process(data, view)
+                self.render_results.put(('main', generation, (1, data, display, view, start_time))); return
+            with self.render_lock:
+                # Coarse previews would iterate from scratch, costing more than resuming the full-size orbits; in the
+                # Tiled engine they would compute whole tiles at coarser levels that the final pass never reuses
+                tiled = view.render_engine == 2 and not view.deep and view.render_mode == 0
+                for scale in ((1,) if tiled or self.resumable(view) else RENDER_PASSES):
+                    if cancelled(): return
+                    width, height = max(self.width // scale, 2), max(self.height // scale, 2)
+                    start = time.perf_counter()
+                    result = self.compute_view(width, height, view.max_iter, view, cancelled, with_distance=view.render_mode != 0)
+                    if result is None: return
+                    data, dist = result if view.render_mode else (result, None)
+                    self.profiler.record('iterate', time.perf_counter() - start, **work_counts(data, view.max_iter))
+                    with self.profiler.stage('post'): display = self.post_process(data, view, dist)
+                    self.render_results.put(('main', generation, (scale, data, display, view, start_time)))
+        except Exception as e:
+            print(f"❌ Render failed: {e}")
+    
+    def poll_render_results(self):
+        latest = {}
+        while True:
+            try: kind, generation, payload = self.render_results.get_nowait()
+            except queue.Empty: break
+            if generation == (self.render_generation if kind == 'main' else self.julia_generation): latest[kind] = payload
+        if 'main' in latest: self.show_render(*latest['main'])
+        if 'julia' in latest: self.im_julia.set_array(latest['julia'])
+        if latest: self.fig.canvas.draw_idle()
+    
+    def show_render(self, scale, data, display_data, view, start_time):
+        # Interior masking only applies to plain iteration counts, not the edge-mode composites
+        self.display_data, self.display_max_iter = display_data, view.max_iter if view.render_mode == 0 else None
+        with self.profiler.stage('color', pixels=display_data.size):
+            self.im_main.set_array(self.colorizer(display_data, self.display_max_iter, flip=False))
+        self.im_main.set_extent(view.extent)
+        self.ax_main.set_xlabel('Real offset from centre' if view.deep else 'Real Axis')
+        self.ax_main.set_ylabel('Imaginary offset from centre' if view.deep else 'Imaginary Axis')
+        if scale != 1: return
+        self.fractal_data, self.fractal_view = data, view  # the snapshot that produced fractal_data
+        if self.store_key(view)[0] in self.favorite_keys: self.store_render(view, data, True)
+        with self.profiler.stage('analysis'): self.update_interesting_regions(); self.update_3d_fractal()
+        if self.sonifier is not None: self.sonifier.set_data(data, view.max_iter)
         
         computation_time = time.time() - start_time
         self.computation_times.append(computation_time)
@@ -252,49 +1544,56 @@ Favorites: {len(self.favorite_locations)}"""
             self.computation_times.pop(0)
         
         self.info_text.set_text(self.get_info_text())
-        self.fig.canvas.draw()
-    
-    def save_fractal(self):
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"fractal_{timestamp}.png"
-        hires_data = compute_fractal(self.xmin, self.xmax, self.ymin, self.ymax,
-                                   1920, 1080, self.max_iter * 2, self.fractal_type, self.julia_c)
-        plt.figure(figsize=(19.2, 10.8), dpi=100)
-        plt.imshow(hires_data, extent=[self.xmin, self.xmax, self.ymin, self.ymax],
-                  cmap=plt.cm.hot, origin='lower', interpolation='bilinear')
-        plt.axis('off')
-        plt.savefig(filename, dpi=100, bbox_inches='tight', pad_inches=0)
-        plt.close()
+    
+    def save_fractal(self, filename=None):
+        # Colours straight into a buffer and writes it, no figure needed; '.ppm'/'.raw' names skip PNG encoding
+        filename = filename or f"fractal_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+        view = self.view_snapshot(); view.max_iter *= 2
+        with self.render_lock:
+            result = self.compute_view(1920, 1080, view.max_iter, view, with_distance=view.render_mode != 0)
+        hires_data, dist = result if view.render_mode else (result, None)
+        save_image(self.colorizer(self.post_process(hires_data, view, dist), view.max_iter if view.render_mode == 0 else None), filename)
         print(f"💾 Saved high-resolution fractal: {filename}")
     
+    def export_profile(self, filename=None):
+        filename = self.profiler.export(filename or f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        print(self.profiler.summary()); print(f"⏱️ Saved stage timings: {filename}")
+    
+    def export_poster(self, width=16384, height=None, filename=None, workers=None):
+        # Out-of-core export of the current view at print sizes; height defaults to the view's aspect ratio
+        height = height or round(width * self.span_y / self.span_x)
+        filename = filename or f"fractal_poster_{datetime.now().strftime('%Y%m%d_%H%M%S')}.ppm"
+        render_poster(filename, self.center_x, self.center_y, self.span_x, self.span_y, width, height, self.max_iter * 2,
+                      self.fractal_type, self.julia_c, self.colorizer.cmap, self.colorizer.mode, workers=workers)
+        print(f"🖼️ Saved {width}x{height} poster: {filename}")
+    
     def update_julia_preview(self):
-        julia_data = compute_fractal(-2, 2, -2, 2, 200, 200, 80, 1, self.julia_c)
-        self.im_julia.set_array(julia_data)
-        self.fig.canvas.draw()
+        self.julia_generation += 1
+        self.executor.submit(self.julia_preview_job, self.julia_generation, self.julia_c)
+    
+    def julia_preview_job(self, generation, julia_c):
+        with self.render_lock:
+            if generation == self.julia_generation:
+                self.render_results.put(('julia', generation, compute_fractal(-2, 2, -2, 2, 200, 200, 80, 1, julia_c)))
     
     def on_mouse_press(self, event):
         if event.inaxes == self.ax_main and event.button == 1:
             if hasattr(event, 'key') and event.key == 'shift':
-                center_x, center_y = (self.xmin + self.xmax) / 2, (self.ymin + self.ymax) / 2
-                dx, dy = event.xdata - center_x, event.ydata - center_y
-                self.xmin += dx
-                self.xmax += dx
-                self.ymin += dy
-                self.ymax += dy
+                self.center_x, self.center_y = self.display_to_complex(event.xdata, event.ydata)
                 self.update_fractal()
             else:
                 self.zoom_start = (event.xdata, event.ydata)
     
     def on_mouse_release(self, event):
         if event.inaxes == self.ax_main and event.button == 1 and self.zoom_start:
-            if abs(event.xdata - self.zoom_start[0]) > 0.01 and abs(event.ydata - self.zoom_start[1]) > 0.01:
-                x1, y1 = self.zoom_start
-                x2, y2 = event.xdata, event.ydata
-                self.xmin, self.xmax = min(x1, x2), max(x1, x2)
-                self.ymin, self.ymax = min(y1, y2), max(y1, y2)
+            # Drag thresholds are relative to the view so rectangle zoom keeps working when zoomed in
+            if abs(event.xdata - self.zoom_start[0]) > 0.0025 * self.span_x and abs(event.ydata - self.zoom_start[1]) > 0.0025 * self.span_y:
+                (x1, y1), (x2, y2) = self.display_to_complex(*self.zoom_start), self.display_to_complex(event.xdata, event.ydata)
+                with self.view_context():
+                    self.set_view((x1 + x2) / 2, (y1 + y2) / 2, abs(float(x2 - x1)), abs(float(y2 - y1)))
                 self.update_fractal()
             else:
-                self.zoom(self.zoom_factor, event.xdata, event.ydata)
+                self.zoom(self.zoom_factor, *self.display_to_complex(event.xdata, event.ydata))
             
             if self.zoom_rect:
                 self.zoom_rect.remove()
@@ -314,14 +1613,13 @@ Favorites: {len(self.favorite_locations)}"""
             self.fig.canvas.draw()
     
     def on_key_press(self, event):
-        actions = {'r': self.reset_view, 's': self.save_fractal, ' ': self.toggle_morphing}
+        actions = {'r': self.reset_view, 's': self.save_fractal, ' ': self.toggle_morphing, 'e': self.cycle_render_engine,
+                   'b': self.go_back, 'backspace': self.go_back, 'm': self.cycle_colors, 'n': self.cycle_color_mode,
+                   't': self.export_profile}
         if event.key in actions: actions[event.key]()
+        elif event.key and len(event.key) == 1 and event.key in '123456789': self.open_favorite(int(event.key) - 1)
         elif event.key in ['left', 'right', 'up', 'down']:
-            dx, dy = (self.xmax - self.xmin) * 0.1, (self.ymax - self.ymin) * 0.1
-            if event.key == 'left': self.xmin -= dx; self.xmax -= dx
-            elif event.key == 'right': self.xmin += dx; self.xmax += dx
-            elif event.key == 'up': self.ymin += dy; self.ymax += dy
-            elif event.key == 'down': self.ymin -= dy; self.ymax -= dy
+            self.pan(*{'left': (-0.1, 0), 'right': (0.1, 0), 'up': (0, 0.1), 'down': (0, -0.1)}[event.key])
             self.update_fractal()
     
     def setup_3d_view(self):
@@ -338,93 +1636,118 @@ Favorites: {len(self.favorite_locations)}"""
             self.ax_stats.set_ylabel('Computation Time (s)')
     
     def update_interesting_regions(self):
-        self.interesting_regions = detect_interesting_regions(self.fractal_data)
+        self.interesting_regions = detect_interesting_regions(self.fractal_data); self.regions_source = self.fractal_data
         self.update_region_markers()
     
     def update_region_markers(self):
         for marker in self.region_markers:
             marker.remove()
         self.region_markers.clear()
+        x0, x1, y0, y1 = self.view_extent()
         for x, y in self.interesting_regions:
-            real_x = self.xmin + x * (self.xmax - self.xmin) / self.width
-            real_y = self.ymin + y * (self.ymax - self.ymin) / self.height
-            circle = Circle((real_x, real_y), abs(self.xmax - self.xmin) * 0.02,
+            real_x = x0 + x * (x1 - x0) / (self.width - 1)
+            real_y = y0 + y * (y1 - y0) / (self.height - 1)
+            circle = Circle((real_x, real_y), self.span_x * 0.02,
                           fill=False, edgecolor='cyan', linewidth=2, alpha=0.8)
             self.ax_main.add_patch(circle)
             self.region_markers.append(circle)
     
     def toggle_3d_view(self):
+        # Without a 3D panel from start-up, the main view gives up its right half to one, created on first use
         self.show_3d = not self.show_3d
         print(f"🔷 3D view: {'ON' if self.show_3d else 'OFF'}")
-        self.update_3d_fractal()
+        if self.ax_3d is None or getattr(self, 'main_position', None) is not None:
+            if self.ax_3d is None:
+                self.main_position = self.ax_main.get_position(); x, y, w, h = self.main_position.bounds
+                self.ax_3d = self.fig.add_axes([x + w / 2, y, w / 2, h], projection='3d'); self.setup_3d_view()
+            x, y, w, h = self.main_position.bounds
+            self.ax_main.set_position([x, y, w / 2, h] if self.show_3d else self.main_position); self.ax_3d.set_visible(self.show_3d)
+        self.surface_source = None; self.update_3d_fractal(); self.fig.canvas.draw_idle()
     
     def update_3d_fractal(self):
-        if self.ax_3d and self.show_3d:
-            data_3d, heights = compute_fractal_3d(self.xmin, self.xmax, self.ymin, self.ymax, 50, 50, self.max_iter)
-            x = np.linspace(self.xmin, self.xmax, 50)
-            y = np.linspace(self.ymin, self.ymax, 50)
-            X, Y = np.meshgrid(x, y)
-            self.ax_3d.clear()
-            surf = self.ax_3d.plot_surface(X, Y, heights, cmap='plasma', alpha=0.8, antialiased=True)
-            self.ax_3d.set_title('3D Fractal Landscape')
+        # The landscape reuses the main render's smooth counts (interior as a flat basin) on an adaptive mesh, and
+        # only rebuilds when a new final render has landed; later updates swap the vertices of the same surface
+        if not (self.ax_3d and self.show_3d) or self.surface_source is self.fractal_data: return
+        data = self.surface_source = self.fractal_data
+        heights = np.where(data >= self.max_iter, 0.0, data)
+        rows, cols = adaptive_mesh_indices(heights, self.mesh_budget)
+        x0, x1, y0, y1 = self.view_extent()
+        X, Y = np.meshgrid(np.linspace(x0, x1, data.shape[1])[cols], np.linspace(y0, y1, data.shape[0])[rows])
+        Z = heights[np.ix_(rows, cols)]
+        if self.surface is None:
+            self.surface = self.ax_3d.plot_surface(X, Y, Z, rstride=1, cstride=1, cmap='plasma', alpha=0.8, antialiased=True)
+        else:
+            quads, levels = surface_quads(X, Y, Z)
+            self.surface.set_verts(quads); self.surface.set_array(levels)
+        self.surface.set_clim(Z.min(), max(Z.max(), Z.min() + 1e-9))
+        self.ax_3d.set_xlim(x0, x1); self.ax_3d.set_ylim(y0, y1); self.ax_3d.set_zlim(Z.min(), max(Z.max(), Z.min() + 1e-9))
+        self.fig.canvas.draw_idle()
     
     def toggle_ai_exploration(self):
         self.auto_explore = not self.auto_explore
         print(f"🤖 AI exploration: {'ON' if self.auto_explore else 'OFF'}")
     
     def ai_explore_step(self):
+        # Regions are detected once per final render; region_reuse=False re-runs detection before every step
+        if self.auto_explore and (not self.region_reuse or self.regions_source is not self.fractal_data): self.update_interesting_regions()
         if self.auto_explore and self.interesting_regions:
             region_idx = np.random.randint(len(self.interesting_regions))
             x, y = self.interesting_regions[region_idx]
-            real_x = self.xmin + x * (self.xmax - self.xmin) / self.width
-            real_y = self.ymin + y * (self.ymax - self.ymin) / self.height
-            self.zoom(0.8, real_x, real_y)
+            self.zoom(0.8, *self.pixel_to_complex(x, y))
     
     def toggle_video_recording(self):
-        self.recording_video = not self.recording_video
-        if self.recording_video:
-            print("🎬 Started video recording...")
-            self.video_frames = []
+        # video_source 'fractal' encodes the main fractal at a fixed size; 'canvas' records the whole figure
+        if not self.recording_video:
+            filename = f"fractal_exploration_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4"
+            try: self.video_encoder = VideoEncoder(filename, (self.width, self.height) if self.video_source == 'fractal' else None,
+                                                    profiler=self.profiler)
+            except Exception as e: print(f"❌ Video recording failed: {e}"); return
+            self.recording_video = True
+            print(f"🎬 Started video recording to {filename}...")
         else:
-            if self.video_frames:
-                self.save_video()
+            self.recording_video = False
+            self.save_video()
             print("⏹️ Stopped video recording")
     
     def save_video(self):
-        if not self.video_frames:
-            return
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"fractal_exploration_{timestamp}.mp4"
-        try:
-            height, width = self.video_frames[0].shape[:2]
-            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-            out = cv2.VideoWriter(filename, fourcc, 10.0, (width, height))
-            for frame in self.video_frames:
-                frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-                out.write(frame_bgr)
-            out.release()
-            print(f"🎥 Saved video: {filename} ({len(self.video_frames)} frames)")
-        except Exception as e:
-            print(f"❌ Video save failed: {e}")
+        # Frames are already on disk; closing without waiting lets the encoder finish its short queue in the background
+        encoder, self.video_encoder = self.video_encoder, None
+        if encoder is None: return
+        encoder.close(wait=False)
+        print(f"🎥 Saving video: {encoder.filename} ({encoder.dropped} frames dropped while the encoder was busy)")
     
     def capture_frame(self):
-        if self.recording_video:
-            self.fig.canvas.draw()
-            buf = np.frombuffer(self.fig.canvas.tostring_rgb(), dtype=np.uint8)
-            buf = buf.reshape(self.fig.canvas.get_width_height()[::-1] + (3,))
-            self.video_frames.append(buf.copy())
+        if not self.recording_video: return
+        try:
+            with self.profiler.stage('capture'):
+                if self.video_source == 'fractal':
+                    # The encoder keeps the frame, so colour into a fresh top-down buffer rather than the display one
+                    rgb = np.empty(self.display_data.shape + (3,), np.uint8)
+                    self.video_encoder.write(self.colorizer(self.display_data, self.display_max_iter, out=rgb))
+                else:
+                    self.fig.canvas.draw()
+                    self.video_encoder.write(np.asarray(self.fig.canvas.buffer_rgba())[..., :3].copy())
+        except Exception as e:
+            print(f"❌ Video recording failed: {e}"); self.recording_video = False
+            # Closing ends the encoder thread's drain loop, so it releases the writer and finalises the partial file
+            encoder, self.video_encoder = self.video_encoder, None
+            if encoder is not None: encoder.close(wait=False)
     
     def play_fractal_music(self):
-        print("🎵 Generating fractal music...")
+        # Toggles a looping sweep that follows the view: every finished render is handed to the playing voice bank.
+        # Without a usable sound device one sweep is written to a WAV file instead
+        if self.sonifier is not None:
+            self.sonifier.stop(); self.sonifier = None; print("🔇 Fractal music stopped"); return
+        sonifier = FractalSonifier(self.fractal_data, self.max_iter, duration=5, loop=True)
         try:
-            audio, sample_rate = generate_fractal_music(self.fractal_data, duration=5)
-            print("🔊 Playing fractal sonification...")
-            sd.play(audio, sample_rate)
+            sonifier.play(); self.sonifier = sonifier
+            print("🔊 Playing fractal sonification (press Music again to stop)...")
         except Exception as e:
-            print(f"❌ Audio playback failed: {e}")
+            sonifier.loop = False; filename = f"fractal_music_{datetime.now().strftime('%Y%m%d_%H%M%S')}.wav"
+            print(f"❌ Audio playback failed: {e}\n💾 Wrote {sonifier.write_wav(filename)} instead")
     
     def toggle_gpu_acceleration(self):
-        if GPU_AVAILABLE:
+        if gpu_available():
             self.gpu_enabled = not self.gpu_enabled
             self.btn_gpu.label.set_text(f"{'⚡GPU' if self.gpu_enabled else '💻CPU'}")
             print(f"⚡ GPU acceleration: {'ON' if self.gpu_enabled else 'OFF'}")
@@ -447,14 +1770,295 @@ Favorites: {len(self.favorite_locations)}"""
     
     def __del__(self):
         if hasattr(self, 'executor'):
-            self.executor.shutdown(wait=False)
+            self.executor.shutdown(wait=False, cancel_futures=True)
 
-if __name__ == "__main__":
+def kernel_signatures():
+    # Explicit argument types of every entry-point kernel, exactly as the Python wrappers call them
+    from numba import types as nt
+    arr = lambda dtype, ndim, readonly=False: nt.Array(dtype, ndim, 'C', readonly=readonly)
+    f8, f4, i8, b1, c16 = nt.float64, nt.float32, nt.int64, nt.boolean, nt.complex128
+    sigs = []
+    for dt in (f8, f4):
+        sigs += [(kernel, (arr(dt, 1), arr(dt, 1), dt, dt, i8, b1, b1, f8, arr(dt, 2))) for kernel in FRACTAL_KERNELS]
+        sigs.append((_subdivide_kernel, (arr(dt, 1), arr(dt, 1), i8, dt, dt, i8, b1, b1, f8, i8, i8, arr(dt, 2))))
+    sigs += [(_perturbation_kernel, (arr(f8, 1), arr(f8, 1), arr(c16, 1), i8, i8, i8, c16, c16, c16, arr(f8, 2))),
+             (_series_approximation, (arr(c16, 1), f8, f8)),
+             (_resume_kernel, (arr(f8, 1),) * 4 + (arr(i8, 1), i8, i8, f8, f8, b1, f8, arr(nt.int32, 1), arr(f8, 1))),
+             (_distance_kernel, (arr(f8, 1), arr(f8, 1), i8, f8, f8, i8, b1, b1, f8, arr(f8, 2), arr(f8, 2), arr(f8, 2)))]
+    for data in (arr(f8, 2), arr(f4, 2, readonly=True)):  # read-only float32 strips come from poster memmaps
+        sigs += [(_histogram_kernel, (data, f8, f8, f8, arr(i8, 1))),
+                 (_lut_kernel, (data, f8, f8, b1, arr(nt.int32, 1), arr(nt.uint8, 2), f8, b1, arr(nt.uint8, 3)))]
+    return sigs
+
+def warmup(verbose=False):
+    # Compiles every kernel signature up front (loading from the on-disk cache when present), so no frame or
+    # worker ever stalls on compilation; run once after installing or editing the module
+    start = time.perf_counter()
+    for kernel, sig in kernel_signatures():
+        t = time.perf_counter(); kernel.compile(sig)
+        if verbose: print(f"{kernel.__name__:<22}{time.perf_counter() - t:8.2f} s  {', '.join(str(a) for a in sig)[:80]}")
+    return time.perf_counter() - start
+
+def benchmark_startup(width=800, height=600, max_iter=150, repeats=3):
+    # Import time and time to a first coloured frame in fresh interpreters: the first run uses an empty kernel
+    # cache (what a new install or edited module sees), the rest reuse the cache that run wrote
+    import subprocess, tempfile
+    script = ("import time; t0 = time.perf_counter(); import mandelbrot_explorer as me; t1 = time.perf_counter(); "
+              f"me.colorize(me.render_view(-0.5, 0.0, 4.0, 3.0, {width}, {height}, {max_iter})); "
+              "print(t1 - t0, time.perf_counter() - t1)")
+    rows = []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = dict(os.environ, NUMBA_CACHE_DIR=cache_dir, PYTHONPATH=os.path.dirname(os.path.abspath(__file__)))
+        for run in range(1 + repeats):
+            t = time.perf_counter()
+            out = subprocess.run([sys.executable, '-c', script], env=env, capture_output=True, text=True, check=True).stdout
+            t_import, t_frame = (float(v) for v in out.split()[-2:])
+            rows.append(dict(cache='empty' if run == 0 else 'warm', import_time=t_import, first_frame=t_frame, total=time.perf_counter() - t))
+            print(f"{rows[-1]['cache']:<6} cache  import {t_import*1000:7.0f} ms  first frame {t_frame*1000:8.0f} ms  "
+                  f"process total {rows[-1]['total']*1000:8.0f} ms")
+    return rows
+
+def best_time(fn, repeats=3):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter(); fn(); times.append(time.perf_counter() - start)
+    return min(times)
+
+def benchmark_kernels(width=800, height=600, max_iter=800, fractal_types=(0, 1, 2, 3), thread_counts=None, repeats=3):
+    # Times the kernel engine against compute_fractal_reference for each fractal type, dtype and thread count
+    names, bounds = FRACTAL_NAMES, DEFAULT_BOUNDS
+    max_threads = numba.config.NUMBA_NUM_THREADS
+    thread_counts = thread_counts or sorted({1, 2, 4, 8, 16, 32, max_threads} & set(range(1, max_threads + 1)))
+    rows = []
+    for ftype in fractal_types:
+        args = (*bounds[ftype], width, height, max_iter, ftype, complex(-0.7, 0.27015))
+        ref = compute_fractal_reference(*args); t_ref = best_time(lambda: compute_fractal_reference(*args), repeats)
+        for dtype in (np.float64, np.float32):
+            compute_fractal(*args, dtype=dtype)
+            max_diff = float(np.abs(compute_fractal(*args, dtype=dtype) - ref).max())
+            for threads in thread_counts:
+                numba.set_num_threads(threads); t = best_time(lambda: compute_fractal(*args, dtype=dtype), repeats)
+                rows.append(dict(fractal=names[ftype], dtype=np.dtype(dtype).name, threads=threads, time=t,
+                                 speedup=t_ref / t, max_diff=max_diff))
+                print(f"{names[ftype]:<13}{np.dtype(dtype).name:<9}{threads:>3} threads  {t*1000:9.1f} ms  "
+                      f"x{t_ref / t:6.2f} vs reference  max|diff| {max_diff:.3g}")
+    numba.set_num_threads(max_threads)
+    return rows
+
+def benchmark_accelerations(width=800, height=600, max_iters=(800, 5000), repeats=3):
+    # A/B timings of the interior and periodicity checks; 'changed' counts pixels differing from plain iteration
+    views = [('Mandelbrot full set', (-2.5, 1.5, -1.5, 1.5), 0), ('Mandelbrot minibrot', (-1.7600, -1.7500, -0.0035, 0.0035), 0),
+             ('Seahorse valley', (-0.7485, -0.7445, 0.0985, 0.1015), 0), ('Tricorn', (-2.5, 1.5, -1.5, 1.5), 3)]
+    modes = [('plain', False, False), ('interior', True, False), ('periodicity', False, True), ('both', True, True)]
+    rows = []
+    for name, bounds, ftype in views:
+        for max_iter in max_iters:
+            plain = compute_fractal(*bounds, width, height, max_iter, ftype, interior_check=False, periodicity=False)
+            for mode, interior_check, periodicity in modes:
+                run = lambda: compute_fractal(*bounds, width, height, max_iter, ftype,
+                                              interior_check=interior_check, periodicity=periodicity)
+                result = run(); t = best_time(run, repeats); changed = int((result != plain).sum())
+                rows.append(dict(view=name, max_iter=max_iter, mode=mode, time=t, changed=changed))
+                print(f"{name:<22}{max_iter:>6} iters  {mode:<12}{t*1000:9.1f} ms  changed pixels: {changed}")
+    return rows
+
+def benchmark_subdivision(width=800, height=600, max_iter=800, repeats=3):
+    # Compares the subdivision renderer with the per-pixel engine and reports the share of pixels it skipped
+    views = [('Mandelbrot full set', (-2.5, 1.5, -1.5, 1.5), 0), ('Mandelbrot minibrot', (-1.7600, -1.7500, -0.0035, 0.0035), 0),
+             ('Seahorse valley', (-0.7485, -0.7445, 0.0985, 0.1015), 0), ('Julia', (-2, 2, -2, 2), 1),
+             ('Burning Ship', (-2.5, 1.5, -2.5, 1.5), 2), ('Tricorn', (-2.5, 1.5, -1.5, 1.5), 3)]
+    rows = []
+    for name, bounds, ftype in views:
+        pixel = compute_fractal(*bounds, width, height, max_iter, ftype)
+        result, skipped = compute_fractal_subdivided(*bounds, width, height, max_iter, ftype)
+        t_pixel = best_time(lambda: compute_fractal(*bounds, width, height, max_iter, ftype), repeats)
+        t_sub = best_time(lambda: compute_fractal_subdivided(*bounds, width, height, max_iter, ftype), repeats)
+        rows.append(dict(view=name, pixel_time=t_pixel, subdivide_time=t_sub, skipped=skipped / result.size,
+                         changed=int((result != pixel).sum())))
+        print(f"{name:<22}pixel {t_pixel*1000:8.1f} ms  subdivide {t_sub*1000:8.1f} ms  "
+              f"skipped {skipped / result.size:6.1%}  changed pixels: {rows[-1]['changed']}")
+    return rows
+
+def benchmark_regions(sizes=((800, 600), (1920, 1080), (4000, 3000)), max_iter=300, repeats=3, dbscan_max_pixels=2_100_000):
+    # Times the block-statistics detector against the original DBSCAN one. 'offset' is how far the worst DBSCAN
+    # centre lies from the nearest peak, as a fraction of the frame width; the two rank regions differently, so all
+    # peaks are compared rather than the top five. DBSCAN is skipped above dbscan_max_pixels
+    views = [('Mandelbrot full set', (-2.5, 1.5, -1.5, 1.5), 0), ('Seahorse valley', (-0.7485, -0.7445, 0.0985, 0.1015), 0),
+             ('Julia', (-2, 2, -2, 2), 1), ('Burning Ship', (-2.5, 1.5, -2.5, 1.5), 2)]
+    rows = []
+    for name, bounds, ftype in views:
+        for width, height in sizes:
+            data = compute_fractal(*bounds, width, height, max_iter, ftype)
+            t_peaks = best_time(lambda: detect_interesting_regions(data), repeats)
+            row = dict(view=name, size=(width, height), peaks_time=t_peaks, dbscan_time=None, offset=None)
+            if width * height <= dbscan_max_pixels:
+                old = detect_interesting_regions(data, method='dbscan')
+                row['dbscan_time'] = best_time(lambda: detect_interesting_regions(data, method='dbscan'), 1)
+                peaks = detect_interesting_regions(data, num_regions=None)
+                if old and peaks:
+                    row['offset'] = max(min(math.hypot(x - gx, y - gy) for gx, gy in peaks) for x, y in old) / width
+            rows.append(row)
+            dbscan = f"dbscan {row['dbscan_time']*1000:9.1f} ms" if row['dbscan_time'] is not None else 'dbscan   skipped   '
+            offset = f"worst offset {row['offset']:.1%} of width" if row['offset'] is not None else ''
+            print(f"{name:<22}{width:>5}x{height:<5} peaks {t_peaks*1000:6.2f} ms  {dbscan}  {offset}")
+    return rows
+
+# Fixed views for the regression suite, as keyframes; deep views always go through perturbation, so their
+# 'engines' are perturbation with and without series approximation
+REFERENCE_VIEWS = [
+    ('Full set', dict(bounds=(-2.5, 1.5, -1.5, 1.5), max_iter=500)),
+    ('Seahorse valley', dict(bounds=(-0.7485, -0.7445, 0.0985, 0.1015), max_iter=5000)),
+    ('Deep zoom', dict(center=('-0.743643887037158704752191506114774', '0.131825904205311970493132056385139'),
+                       span=(4e-14, 3e-14), max_iter=5000)),
+    ('Julia', dict(fractal_type=1, bounds=(-2, 2, -1.5, 1.5), julia_c=(-0.8, 0.156), max_iter=1000)),
+    ('Burning Ship', dict(fractal_type=2, bounds=(-2.5, 1.5, -2.5, 1.5), max_iter=1000)),
+]
+
+def reference_engines(view, width, height):
+    v = parse_keyframe(view)
+    args = (v['center_x'], v['center_y'], v['span_x'], v['span_y'], width, height, v['max_iter'], v['fractal_type'], v['julia_c'])
+    if is_deep_view(*args[:6]):
+        return {'Perturbation': lambda: compute_fractal_perturbation(*args),
+                'Perturbation (no series)': lambda: compute_fractal_perturbation(*args, series=False)}
+    cx, cy = float(v['center_x']), float(v['center_y'])
+    bounds = (cx - v['span_x'] / 2, cx + v['span_x'] / 2, cy - v['span_y'] / 2, cy + v['span_y'] / 2, width, height)
+    rest = (v['max_iter'], v['fractal_type'], v['julia_c'])
+    return {'Pixel': lambda: compute_fractal(*bounds, *rest),
+            'Subdivide': lambda: compute_fractal_subdivided(*bounds, *rest)[0],
+            'Tiled': lambda: render_tiled(TileCache(), *bounds, *rest)}  # a fresh cache, so tiles are timed cold
+
+def benchmark_reference(width=640, height=480, repeats=3, views=None, output=None, baseline=None, tolerance=0.15):
+    # Times every engine on the reference views. 'diff' is the share of pixels more than one iteration away from
+    # the first engine listed for that view. With `baseline` (a file written through `output`), rows slower than the baseline by more
+    # than `tolerance` are reported as regressions; timings are only comparable on the same machine and size
+    rows = []
+    for name, view in views or REFERENCE_VIEWS:
+        max_iter, first = parse_keyframe(view)['max_iter'], None
+        for engine, run in reference_engines(view, width, height).items():
+            data = run(); t = best_time(run, repeats); first = data if first is None else first
+            counts = work_counts(data, max_iter)
+            rows.append(dict(view=name, engine=engine, width=width, height=height, max_iter=max_iter, time=t,
+                             pixels_per_s=counts['pixels'] / t, iterations_per_s=counts['iterations'] / t,
+                             escaped=counts['escaped'] / counts['pixels'], diff=float(np.mean(np.abs(data - first) > 1))))
+            print(f"{name:<17}{engine:<26}{t*1000:9.1f} ms  {counts['pixels'] / t / 1e6:7.1f} Mpix/s  "
+                  f"{counts['iterations'] / t / 1e9:6.2f} Giter/s  escaped {rows[-1]['escaped']:6.1%}  diff {rows[-1]['diff']:.2%}")
+    if output:
+        with open(output, 'w') as f: json.dump(dict(rows=rows, threads=numba.config.NUMBA_NUM_THREADS, time=datetime.now().isoformat()), f, indent=1)
+    if baseline:
+        with open(baseline) as f: before = {(r['view'], r['engine'], r['width'], r['height'], r['max_iter']): r['time'] for r in json.load(f)['rows']}
+        regressions = []
+        for r in rows:
+            old = before.get((r['view'], r['engine'], r['width'], r['height'], r['max_iter']))
+            if old is None: continue
+            r['baseline'] = old; r['change'] = r['time'] / old - 1
+            if r['change'] > tolerance: regressions.append(r)
+            print(f"{r['view']:<17}{r['engine']:<26}{old*1000:9.1f} -> {r['time']*1000:9.1f} ms  {r['change']:+7.1%}"
+                  f"{'  ⚠️ REGRESSION' if r['change'] > tolerance else ''}")
+        print(f"{len(regressions)} regression(s) beyond {tolerance:.0%}" if regressions else f"✅ No regressions beyond {tolerance:.0%}")
+    return rows
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description='Ultra-Advanced Fractal Explorer')
+    parser.add_argument('--profile', default=None, metavar='FILE', help='GUI: append per-stage timings to FILE as JSON lines')
+    sub = parser.add_subparsers(dest='command')
+    bench = sub.add_parser('bench', help='run a performance benchmark instead of the GUI')
+    bench.add_argument('suite', choices=['kernels', 'accel', 'subdivide', 'regions', 'startup', 'reference'], nargs='?', default='kernels')
+    bench.add_argument('--size', type=int, nargs=2, default=None, metavar=('WIDTH', 'HEIGHT'), help='default 800x600, 640x480 for reference')
+    bench.add_argument('--max-iter', type=int, default=800)
+    bench.add_argument('--repeats', type=int, default=3)
+    bench.add_argument('--output', default=None, help='reference: save the results as JSON for later comparison')
+    bench.add_argument('--baseline', default=None, help='reference: JSON from an earlier --output run to compare against')
+    bench.add_argument('--tolerance', type=float, default=0.15, help='reference: slowdown reported as a regression')
+    sub.add_parser('warmup', help='compile every kernel into the on-disk cache so later runs start instantly')
+    render = sub.add_parser('render', help='render a JSON keyframe job headlessly to PNG frames or a video file')
+    render.add_argument('job', help='JSON job: width, height, frames, fps, output and a list of keyframes')
+    render.add_argument('--workers', type=int, default=None, help='render processes (default: one per core)')
+    render.add_argument('--output', default=None, help="frame pattern like 'out/frame_{:05d}.png' or a .mp4/.avi file")
+    poster = sub.add_parser('poster', help='render a resumable out-of-core poster to a .ppm/.raw file')
+    poster.add_argument('output')
+    poster.add_argument('--size', type=int, nargs=2, default=(16384, 16384), metavar=('WIDTH', 'HEIGHT'))
+    poster.add_argument('--center', nargs=2, default=None, metavar=('RE', 'IM'), help='decimal strings keep deep-zoom digits')
+    poster.add_argument('--span', type=float, default=None, help='real-axis width; the imaginary span follows the aspect ratio')
+    poster.add_argument('--fractal', choices=FRACTAL_NAMES, default='Mandelbrot')
+    poster.add_argument('--julia-c', type=float, nargs=2, default=(-0.7, 0.27015), metavar=('RE', 'IM'))
+    poster.add_argument('--max-iter', type=int, default=1000)
+    poster.add_argument('--cmap', choices=COLORMAPS, default='hot')
+    poster.add_argument('--color-mode', choices=COLOR_MODES, default='Linear')
+    poster.add_argument('--tile', type=int, default=POSTER_TILE)
+    poster.add_argument('--workers', type=int, default=None)
+    poster.add_argument('--keep-data', action='store_true', help='keep the float32 iteration memmap next to the image')
+    sonify = sub.add_parser('sonify', help='render the additive-synthesis sonification of a view to a WAV file')
+    sonify.add_argument('output')
+    sonify.add_argument('--center', nargs=2, default=None, metavar=('RE', 'IM'))
+    sonify.add_argument('--span', type=float, default=None)
+    sonify.add_argument('--fractal', choices=FRACTAL_NAMES, default='Mandelbrot')
+    sonify.add_argument('--julia-c', type=float, nargs=2, default=(-0.7, 0.27015), metavar=('RE', 'IM'))
+    sonify.add_argument('--max-iter', type=int, default=300)
+    sonify.add_argument('--duration', type=float, default=10.0)
+    sonify.add_argument('--sample-rate', type=int, default=22050)
+    sonify.add_argument('--voices', type=int, default=24)
+    prewarm = sub.add_parser('prewarm', help='render saved favorites or a keyframe job into the render store ahead of time')
+    prewarm.add_argument('--job', default=None, help='JSON keyframe job whose frames are stored (default: the saved favorites)')
+    prewarm.add_argument('--size', type=int, nargs=2, default=None, metavar=('WIDTH', 'HEIGHT'), help='explorer view size (default 800x600)')
+    prewarm.add_argument('--store', default=STORE_PATH)
+    prewarm.add_argument('--max-bytes', type=float, default=2**30)
+    args = parser.parse_args(argv)
+    if args.command == 'prewarm':
+        store, start = RenderStore(args.store, int(args.max_bytes)), time.time()
+        if args.job:
+            job = load_job(args.job); views = interpolate_keyframes(job['keyframes'], int(job.get('frames', 1)))
+            width, height = args.size or (int(job.get('width', 800)), int(job.get('height', 600)))
+        else:
+            views, (width, height) = store.load_favorites(), args.size or (800, 600)
+            if args.size: views = [dict(v, width=width, height=height) for v in views]
+        rendered = prewarm_store(views, width, height, store, lambda done, total: print(f"\r🗄️ View {done}/{total}", end='', flush=True),
+                                 pinned=not args.job)
+        stats = store.stats(); nbytes = stats['nbytes'] + stats['pinned_nbytes']
+        print(f"\n💾 Stored {rendered} new render(s) of {len(views)} in {time.time() - start:.1f}s ({nbytes / 2**20:.0f} MB on disk)")
+        return rendered
+    if args.command == 'sonify':
+        ftype = FRACTAL_NAMES.index(args.fractal); xmin, xmax, ymin, ymax = DEFAULT_BOUNDS[ftype]
+        center = args.center or ((xmin + xmax) / 2, (ymin + ymax) / 2); span_x = args.span or max(xmax - xmin, (ymax - ymin) * 4 / 3)
+        data = render_view(center[0], center[1], span_x, span_x * 3 / 4, 800, 600, args.max_iter, ftype, complex(*args.julia_c))
+        start = time.time()
+        FractalSonifier(data, args.max_iter, args.duration, args.sample_rate, args.voices).write_wav(args.output)
+        print(f"💾 Wrote {args.output} ({args.duration:.1f}s of audio) in {time.time() - start:.2f}s"); return args.output
+    if args.command == 'poster':
+        ftype = FRACTAL_NAMES.index(args.fractal); xmin, xmax, ymin, ymax = DEFAULT_BOUNDS[ftype]; (width, height) = args.size
+        center = args.center or ((xmin + xmax) / 2, (ymin + ymax) / 2)
+        span_x = args.span or max(xmax - xmin, (ymax - ymin) * width / height)
+        start = time.time()
+        render_poster(args.output, center[0], center[1], span_x, span_x * height / width, width, height, args.max_iter, ftype,
+                      complex(*args.julia_c), args.cmap, args.color_mode, args.tile, args.workers,
+                      lambda done, total: print(f"\r🧱 Tile {done}/{total}", end='', flush=True), args.keep_data)
+        print(f"\n💾 Wrote {args.output} ({width}x{height}) in {time.time() - start:.1f}s"); return args.output
+    if args.command == 'warmup':
+        print(f"🔥 Kernels ready in {warmup(verbose=True):.1f}s"); return
+    if args.command == 'render':
+        start = time.time()
+        written = render_animation(args.job, args.workers, args.output,
+                                   progress=lambda done, total: print(f"\r🎞️ Frame {done}/{total}", end='', flush=True))
+        print(f"\n💾 Wrote {len(written)} file(s) in {time.time() - start:.1f}s"); return written
+    if args.command == 'bench':
+        if args.suite == 'reference':
+            rows = benchmark_reference(*(args.size or (640, 480)), args.repeats, output=args.output, baseline=args.baseline, tolerance=args.tolerance)
+            if any(r.get('change', 0) > args.tolerance for r in rows): sys.exit(1)
+            return rows
+        args.size = args.size or (800, 600)
+        if args.suite == 'accel': return benchmark_accelerations(*args.size)
+        if args.suite == 'subdivide': return benchmark_subdivision(*args.size, max_iter=args.max_iter)
+        if args.suite == 'regions': return benchmark_regions(max_iter=args.max_iter)
+        if args.suite == 'startup': return benchmark_startup(*args.size, max_iter=args.max_iter)
+        return benchmark_kernels(*args.size, max_iter=args.max_iter)
     print("🚀 ======= ULTRA-ADVANCED FRACTAL EXPLORER AI ======= 🚀")
     print("🎨 Features: 3D landscapes, AI exploration, video recording, fractal music, GPU acceleration")
-    print("🎮 Controls: Drag-to-zoom, keyboard shortcuts (R:Reset, S:Save, Space:Morph, Arrows:Pan)")
+    print("🎮 Controls: Drag-to-zoom, keyboard shortcuts (R:Reset, S:Save, E:Engine, B:Back, M/N:Colors, Space:Morph, Arrows:Pan)")
     print("🧠 AI: Automatic region detection, smart zoom recommendations, performance optimization")
     print("🎥 Export: 4K images, MP4 videos, fractal music, JSON bookmarks")
-    print(f"⚡ {'GPU acceleration available!' if GPU_AVAILABLE else 'Running on CPU (install CUDA for GPU acceleration)'}")
+    print(f"⚡ {'GPU acceleration available!' if gpu_available() else 'Running on CPU (install CUDA for GPU acceleration)'}")
     print("\n🌟 Starting the most advanced fractal explorer ever created...\n🚀 Prepare for an incredible mathematical journey!")
-    AdvancedFractalExplorer(width=800, height=600).show()
+    AdvancedFractalExplorer(width=800, height=600, profile=args.profile).show()
+
+if __name__ == "__main__":
+    main()